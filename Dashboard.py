@@ -7,9 +7,40 @@ from plotly.subplots import make_subplots
 import warnings
 warnings.filterwarnings('ignore')
 from datetime import datetime
-import base64
+import functools
+import json
+import os
+import tempfile
+import time
 from io import BytesIO
 
+from jupiter_core import JupiterDataAnalyzer, frame_nbytes, slice_years
+from jupiter_events import jupiter_event_frame
+from jupiter_cache import HAS_PYARROW, DatasetCache, FigureCache, frame_fingerprint
+from jupiter_downsampling import downsample_indices
+from jupiter_profiling import Profiler, profiled, stage
+
+# Cache mémoire des jeux générés, partagé entre toutes les sessions du serveur
+DATA_CACHE_TTL = 3600
+DATA_CACHE_MAX_ENTRIES = 64
+# Types de stockage des jeux en mémoire : float32 et catégories (voir jupiter_core.apply_dtype_policy)
+DATA_DTYPE_POLICY = 'compact'
+# Pas de temps proposés (l'horaire, ~3,6 millions de lignes sur 1610-2025, reste réservé à Jupiter.py)
+DASHBOARD_RESOLUTIONS = {
+    'yearly': "Annuelle",
+    'monthly': "Mensuelle",
+    'daily': "Journalière",
+}
+
+# Largeur d'affichage de référence des graphiques (px) : au plus un point par pixel et par trace
+CHART_WIDTH_PX = 1400
+# Au-delà de ce nombre de points, une trace est rendue en WebGL (Scattergl) plutôt qu'en SVG
+WEBGL_THRESHOLD = 1000
+
+# Exports : CSV écrit par blocs de lignes, en mémoire puis sur disque au-delà de la limite
+EXPORT_CSV_CHUNK_ROWS = 50_000
+EXPORT_SPOOL_MAX_BYTES = 16 * 1024 ** 2
+
 # Configuration de la page
 st.set_page_config(
     page_title="♃ Jupiter Data Dashboard",
@@ -97,18 +128,18 @@ st.markdown("""
         margin: 0.2rem;
         border: 1px solid #FFD700;
     }
-    .stTabs [data-baseweb="tab-list"] {
+    .st-key-section [role="radiogroup"] {
         gap: 8px;
         background-color: #1A0F0A;
     }
-    .stTabs [data-baseweb="tab"] {
+    .st-key-section label[data-baseweb="radio"] {
         background-color: #2C1810;
         border-radius: 4px 4px 0px 0px;
         padding: 10px 20px;
         color: #D8CA9D;
         border: 1px solid #B8A86D;
     }
-    .stTabs [aria-selected="true"] {
+    .st-key-section label[data-baseweb="radio"]:has(input:checked) {
         background: linear-gradient(135deg, #B8A86D, #D8CA9D);
         color: #2C1810;
         font-weight: bold;
@@ -126,426 +157,92 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-class JupiterDataAnalyzer:
-    def __init__(self, data_type):
-        self.data_type = data_type
-        self.colors = ['#D8CA9D', '#B8A86D', '#9B8E64', '#C9B27C', '#E0D0A8',
-                      '#A8996D', '#D4C49E', '#F0E6C8', '#8C7C5E', '#B5A885']
-        
-        self.start_year = 1610
-        self.end_year = 2025
-        
-        self.config = self._get_jupiter_config()
-        
-    def _get_jupiter_config(self):
-        configs = {
-            "atmospheric_temperature": {
-                "base_value": -145,
-                "cycle_years": 11.86,
-                "amplitude": 20,
-                "trend": "stable",
-                "unit": "°C",
-                "description": "🌡️ Température atmosphérique",
-                "icon": "🌡️",
-                "color": "#B8A86D",
-                "range": [-165, -125]
-            },
-            "wind_speeds": {
-                "base_value": 150,
-                "cycle_years": 11.86,
-                "amplitude": 100,
-                "trend": "jet_streams",
-                "unit": "km/h",
-                "description": "💨 Vitesse des vents",
-                "icon": "💨",
-                "color": "#C9B27C",
-                "range": [50, 600]
-            },
-            "great_red_spot": {
-                "base_value": 16000,
-                "cycle_years": 11.86,
-                "amplitude": 2000,
-                "trend": "shrinking",
-                "unit": "km",
-                "description": "🔴 Grande Tache Rouge",
-                "icon": "🔴",
-                "color": "#FF4500",
-                "range": [14000, 18000]
-            },
-            "magnetic_field": {
-                "base_value": 4200000,
-                "cycle_years": 11.86,
-                "amplitude": 100000,
-                "trend": "stable",
-                "unit": "nT",
-                "description": "🧲 Champ magnétique",
-                "icon": "🧲",
-                "color": "#9B8E64",
-                "range": [4000000, 4300000]
-            },
-            "radiation_belts": {
-                "base_value": 3500,
-                "cycle_years": 11.86,
-                "amplitude": 500,
-                "trend": "variable",
-                "unit": "rads/h",
-                "description": "☢️ Ceintures de radiation",
-                "icon": "☢️",
-                "color": "#FFD700",
-                "range": [3000, 4000]
-            },
-            "auroral_activity": {
-                "base_value": 80,
-                "cycle_years": 11.86,
-                "amplitude": 40,
-                "trend": "solar_dependent",
-                "unit": "intensité",
-                "description": "✨ Activité aurorale",
-                "icon": "✨",
-                "color": "#00CED1",
-                "range": [40, 120]
-            },
-            "ring_system": {
-                "base_value": 30,
-                "cycle_years": 11.86,
-                "amplitude": 5,
-                "trend": "stable",
-                "unit": "albédo",
-                "description": "💫 Système d'anneaux",
-                "icon": "💫",
-                "color": "#E0D0A8",
-                "range": [25, 35]
-            },
-            "moons_activity": {
-                "base_value": 65,
-                "cycle_years": 11.86,
-                "amplitude": 20,
-                "trend": "volcanic",
-                "unit": "index",
-                "description": "🌕 Activité des lunes",
-                "icon": "🌕",
-                "color": "#DA70D6",
-                "range": [45, 85]
-            },
-            "atmospheric_composition": {
-                "base_value": 90,
-                "cycle_years": 11.86,
-                "amplitude": 5,
-                "trend": "stable",
-                "unit": "% H₂",
-                "description": "🧪 Composition H₂",
-                "icon": "🧪",
-                "color": "#A8996D",
-                "range": [85, 95]
-            },
-            "orbital_parameters": {
-                "base_value": 5.20,
-                "cycle_years": 11.86,
-                "amplitude": 0.20,
-                "trend": "stable",
-                "unit": "UA",
-                "description": "🛸 Distance au Soleil",
-                "icon": "🛸",
-                "color": "#B5A885",
-                "range": [5.00, 5.40]
-            }
-        }
-        return configs.get(self.data_type, configs["wind_speeds"])
-    
-    def generate_jupiter_data(self):
-        years = list(range(self.start_year, self.end_year + 1))
-        
-        data = {'Earth_Year': years}
-        data['Jupiter_Year'] = self._earth_to_jupiter_years(years)
-        data['Solar_Distance'] = self._simulate_solar_distance(years)
-        
-        # Données principales
-        data['Base_Value'] = self._simulate_jupiter_cycle(years)
-        data['Seasonal_Variation'] = self._simulate_seasonal_variation(years)
-        data['Atmospheric_Storms'] = self._simulate_atmospheric_storms(years)
-        data['Magnetic_Activity'] = self._simulate_magnetic_activity(years)
-        data['Great_Red_Spot_Evolution'] = self._simulate_great_red_spot(years)
-        data['Radiation_Variations'] = self._simulate_radiation_variations(years)
-        data['Moon_Influences'] = self._simulate_moon_influences(years)
-        data['Smoothed_Value'] = self._simulate_smoothed_data(years)
-        data['Short_Term_Variation'] = self._simulate_short_term_variation(years)
-        data['Long_Term_Trend'] = self._simulate_long_term_trend(years)
-        data['Jupiter_Index'] = self._simulate_jupiter_index(years)
-        data['Observation_Quality'] = self._simulate_observation_quality(years)
-        data['Future_Prediction'] = self._simulate_future_prediction(years)
-        data['Storm_Intensity'] = self._simulate_storm_intensity(years)
-        data['Auroral_Power'] = self._simulate_auroral_power(years)
-        
-        df = pd.DataFrame(data)
-        self._add_jupiter_events(df)
-        
-        return df
-    
-    def _earth_to_jupiter_years(self, years):
-        jupiter_years = []
-        jupiter_year_duration = 11.86
-        
-        for earth_year in years:
-            jupiter_year = (earth_year - self.start_year) / jupiter_year_duration
-            jupiter_years.append(jupiter_year)
-        return jupiter_years
-    
-    def _simulate_solar_distance(self, years):
-        distances = []
-        for earth_year in years:
-            base_distance = 5.20
-            variation = 0.05 * np.sin(2 * np.pi * (earth_year - self.start_year) / 11.86)
-            distance = base_distance + variation
-            distances.append(distance)
-        return distances
-    
-    def _simulate_jupiter_cycle(self, years):
-        base_value = self.config["base_value"]
-        cycle_years = self.config["cycle_years"]
-        amplitude = self.config["amplitude"]
-        
-        values = []
-        for earth_year in years:
-            jupiter_phase = (earth_year - self.start_year) % cycle_years
-            seasonal_cycle = np.sin(2 * np.pi * jupiter_phase / cycle_years)
-            
-            spot_cycle_years = 12.5
-            spot_phase = (earth_year - self.start_year) % spot_cycle_years
-            spot_cycle = np.cos(2 * np.pi * spot_phase / spot_cycle_years)
-            
-            solar_cycle_years = 11.0
-            solar_phase = (earth_year - self.start_year) % solar_cycle_years
-            solar_cycle = np.sin(2 * np.pi * solar_phase / solar_cycle_years)
-            
-            if self.config["trend"] == "jet_streams":
-                value = base_value + amplitude * (0.6 * seasonal_cycle + 0.4 * spot_cycle)
-            elif self.config["trend"] == "shrinking":
-                years_since_start = earth_year - self.start_year
-                shrinkage = -0.01 * years_since_start
-                value = base_value + amplitude * seasonal_cycle + shrinkage
-            elif self.config["trend"] == "solar_dependent":
-                value = base_value + amplitude * (0.7 * solar_cycle + 0.3 * seasonal_cycle)
-            elif self.config["trend"] == "volcanic":
-                volcanic_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 7.3)
-                value = base_value + amplitude * volcanic_cycle
-            else:
-                value = base_value + amplitude * seasonal_cycle
-            
-            noise = np.random.normal(0, amplitude * 0.1)
-            values.append(value + noise)
-        return values
-    
-    def _simulate_seasonal_variation(self, years):
-        variations = []
-        for earth_year in years:
-            seasonal_variation = 0.1 * np.sin(2 * np.pi * (earth_year - self.start_year) / 11.86)
-            variations.append(1 + seasonal_variation)
-        return variations
-    
-    def _simulate_atmospheric_storms(self, years):
-        storm_activities = []
-        for earth_year in years:
-            short_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 3.2)
-            medium_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 7.5)
-            long_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 15.8)
-            
-            storm_activity = 1.0 + 0.3 * short_cycle + 0.2 * medium_cycle + 0.1 * long_cycle
-            storm_activities.append(storm_activity)
-        return storm_activities
-    
-    def _simulate_storm_intensity(self, years):
-        intensities = []
-        base_intensity = self._simulate_atmospheric_storms(years)
-        for i, val in enumerate(base_intensity):
-            intensity = val * 100 + np.random.normal(0, 10)
-            intensities.append(max(0, intensity))
-        return intensities
-    
-    def _simulate_magnetic_activity(self, years):
-        magnetic_activities = []
-        for earth_year in years:
-            magnetic_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 9.7)
-            magnetic_activity = 1.0 + 0.2 * magnetic_cycle
-            magnetic_activities.append(magnetic_activity)
-        return magnetic_activities
-    
-    def _simulate_great_red_spot(self, years):
-        spot_evolutions = []
-        for earth_year in years:
-            years_since_start = earth_year - self.start_year
-            
-            if earth_year < 1800:
-                size_factor = 1.8
-            elif earth_year < 1900:
-                size_factor = 1.5
-            elif earth_year < 2000:
-                size_factor = 1.2
-            else:
-                size_factor = 1.0 - 0.001 * (earth_year - 2000)
-            
-            short_term = 0.1 * np.sin(2 * np.pi * (earth_year - self.start_year) / 5.3)
-            spot_evolution = size_factor * (1 + short_term)
-            spot_evolutions.append(spot_evolution)
-        return spot_evolutions
-    
-    def _simulate_radiation_variations(self, years):
-        radiation_levels = []
-        for earth_year in years:
-            solar_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 11.0)
-            magnetic_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 9.7)
-            
-            radiation_level = 1.0 + 0.3 * solar_cycle + 0.2 * magnetic_cycle
-            radiation_levels.append(radiation_level)
-        return radiation_levels
-    
-    def _simulate_moon_influences(self, years):
-        moon_influences = []
-        for earth_year in years:
-            io_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 1.77)
-            europa_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 3.55)
-            ganymede_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 7.15)
-            callisto_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 16.69)
-            
-            moon_influence = 1.0 + 0.15 * io_cycle + 0.1 * europa_cycle + 0.05 * ganymede_cycle + 0.03 * callisto_cycle
-            moon_influences.append(moon_influence)
-        return moon_influences
-    
-    def _simulate_smoothed_data(self, years):
-        base_cycle = self._simulate_jupiter_cycle(years)
-        smoothed = []
-        window_size = 5
-        
-        for i in range(len(base_cycle)):
-            start_idx = max(0, i - window_size//2)
-            end_idx = min(len(base_cycle), i + window_size//2 + 1)
-            window = base_cycle[start_idx:end_idx]
-            smoothed.append(np.mean(window))
-        return smoothed
-    
-    def _simulate_short_term_variation(self, years):
-        variations = []
-        for earth_year in years:
-            rapid_variation = 0.05 * np.sin(2 * np.pi * (earth_year - self.start_year) / 0.1)
-            variations.append(1 + rapid_variation)
-        return variations
-    
-    def _simulate_long_term_trend(self, years):
-        trends = []
-        for earth_year in years:
-            years_since_start = earth_year - self.start_year
-            
-            if self.config["trend"] == "shrinking":
-                trend = 1.0 - 0.0005 * years_since_start
-            else:
-                trend = 1.0 + 0.0001 * years_since_start
-            
-            trends.append(trend)
-        return trends
-    
-    def _simulate_auroral_power(self, years):
-        powers = []
-        for earth_year in years:
-            base_power = 100
-            solar_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 11.0)
-            magnetic_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 9.7)
-            
-            power = base_power * (1 + 0.3 * solar_cycle + 0.2 * magnetic_cycle)
-            powers.append(power)
-        return powers
-    
-    def _simulate_jupiter_index(self, years):
-        indices = []
-        base_cycle = self._simulate_jupiter_cycle(years)
-        storm_activity = self._simulate_atmospheric_storms(years)
-        magnetic_activity = self._simulate_magnetic_activity(years)
-        
-        for i in range(len(years)):
-            index = (base_cycle[i] * 0.4 + storm_activity[i] * 30 * 0.3 + magnetic_activity[i] * 1000 * 0.3)
-            indices.append(index)
-        return indices
-    
-    def _simulate_observation_quality(self, years):
-        qualities = []
-        for earth_year in years:
-            if earth_year < 1700:
-                quality = 10
-            elif earth_year < 1800:
-                quality = 20
-            elif earth_year < 1900:
-                quality = 40
-            elif earth_year < 1970:
-                quality = 60
-            elif earth_year < 1990:
-                quality = 80
-            else:
-                quality = 95
-            
-            orbital_variation = 5 * np.sin(2 * np.pi * (earth_year - self.start_year) / 11.86)
-            qualities.append(min(100, quality + orbital_variation))
-        return qualities
-    
-    def _simulate_future_prediction(self, years):
-        predictions = []
-        base_cycle = self._simulate_jupiter_cycle(years)
-        long_term_trend = self._simulate_long_term_trend(years)
-        
-        for i, earth_year in enumerate(years):
-            current_value = base_cycle[i]
-            trend_factor = long_term_trend[i]
-            
-            if earth_year > 2020:
-                years_since_2020 = earth_year - 2020
-                uncertainty = 0.02 * years_since_2020
-                prediction = current_value * trend_factor * (1 + np.random.normal(0, uncertainty))
-            else:
-                prediction = current_value
-            predictions.append(prediction)
-        return predictions
-    
-    def _add_jupiter_events(self, df):
-        events = []
-        for i, row in df.iterrows():
-            earth_year = row['Earth_Year']
-            
-            mission_events = {
-                1610: ("Galilée - Découverte des lunes galiléennes", "discovery", "historique"),
-                1665: ("Première observation de la Grande Tache Rouge", "observation", "majeur"),
-                1831: ("Observations détaillées des bandes", "observation", "majeur"),
-                1973: ("Pioneer 10 - Premier survol", "flyby", "historique"),
-                1979: ("Voyager 1/2 - Découvertes majeures", "flyby", "historique"),
-                1995: ("Galileo - Première orbite", "orbiter", "historique"),
-                2000: ("Cassini - Survol vers Saturne", "flyby", "majeur"),
-                2007: ("New Horizons - Survol vers Pluton", "flyby", "majeur"),
-                2016: ("Juno - Arrivée en orbite polaire", "orbiter", "historique"),
-                2021: ("James Webb - Observations", "telescope", "majeur")
-            }
-            
-            if earth_year in mission_events:
-                event_name, event_type, severity = mission_events[earth_year]
-                events.append({
-                    "year": earth_year,
-                    "event": event_name,
-                    "type": event_type,
-                    "severity": severity,
-                    "jupiter_year": row['Jupiter_Year']
-                })
-                df.loc[i, 'Observation_Quality'] = min(100, df.loc[i, 'Observation_Quality'] + 5)
+@st.cache_data(ttl=DATA_CACHE_TTL, max_entries=DATA_CACHE_MAX_ENTRIES,
+               show_spinner="♃ Génération des données joviennes en cours...")
+def load_jupiter_data(data_type, start_year, end_year, seed, resolution='yearly', dtype_policy=DATA_DTYPE_POLICY):
+    """Génère (ou relit) un jeu de données ; clé de cache = tuple des paramètres hachables.
+    
+    Retourne (données, événements, octets économisés par la politique de types).
+    """
+    analyzer = JupiterDataAnalyzer(data_type, seed=seed, resolution=resolution, cache=DatasetCache(),
+                                   dtype_policy=dtype_policy)
+    analyzer.start_year = start_year
+    analyzer.end_year = end_year
+    df = analyzer.generate_jupiter_data()
+    return df, analyzer.events, analyzer.memory_saved
+
+@st.cache_resource
+def get_figure_cache():
+    """Cache des figures sérialisées, partagé par toutes les sessions du serveur"""
+    return FigureCache()
+
+def _figure_fingerprint(value):
+    """Empreinte d'un argument de fonction de visualisation"""
+    if isinstance(value, pd.DataFrame):
+        return frame_fingerprint(value)
+    if isinstance(value, JupiterDataAnalyzer):
+        return value.data_type
+    return json.dumps(value, sort_keys=True, default=str)
+
+def cached_figure(refresh_seconds=None):
+    """Met en cache la figure d'une fonction create_* par chart_id et empreinte de ses données.
+    
+    La figure est conservée en JSON puis reconstruite sans revalidation
+    Plotly ; refresh_seconds force une reconstruction périodique pour les
+    figures qui dépendent de l'heure courante.
+    """
+    def decorator(create):
+        @functools.wraps(create)
+        def wrapper(*args):
+            *data, chart_id = args
+            parts = [create.__name__, chart_id] + [_figure_fingerprint(value) for value in data]
+            if refresh_seconds:
+                parts.append(str(int(time.time() // refresh_seconds)))
+            key = '|'.join(parts)
             
-            # Grandes tempêtes documentées
-            storm_years = [1990, 2006, 2012, 2016, 2020]
-            if earth_year in storm_years:
-                events.append({
-                    "year": earth_year,
-                    "event": "🌪️ Grande tempête atmosphérique",
-                    "type": "storm",
-                    "severity": "majeur",
-                    "jupiter_year": row['Jupiter_Year']
-                })
-                df.loc[i, 'Atmospheric_Storms'] *= 1.5
-        
-        self.events = events
+            cache = get_figure_cache()
+            payload = cache.get(key)
+            if payload is not None:
+                with stage(f'figure/{create.__name__}/from_json'):
+                    return go.Figure(json.loads(payload), _validate=False)
+            with stage(f'figure/{create.__name__}'):
+                fig = create(*args)
+            if fig is not None:
+                with stage(f'figure/{create.__name__}/to_json'):
+                    cache.put(key, fig.to_json())
+            return fig
+        return wrapper
+    return decorator
+
+def downsampled(x, y, width_px=CHART_WIDTH_PX):
+    """Arguments x/y d'une trace réduite à au plus width_px points (LTTB) avant envoi au navigateur"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    index = downsample_indices(x, y, width_px)
+    return dict(x=x[index], y=y[index])
+
+def period_slider(df, key, default=None):
+    """Curseur de période en années civiles ; retourne ((début, fin), lignes de df dans ces années)"""
+    first, last = int(df['Earth_Year'].iloc[0]), int(df['Earth_Year'].iloc[-1])
+    start, end = default or (first, last)
+    year_range = st.slider(
+        "Période d'affichage",
+        min_value=first,
+        max_value=last,
+        value=(min(max(start, first), last), max(min(end, last), first)),
+        key=key
+    )
+    # Années civiles entières : la fin inclut tous les instants de l'année (résolutions infra-annuelles)
+    return year_range, slice_years(df, year_range[0], np.nextafter(year_range[1] + 1, -np.inf))
+
+def scatter_trace(**kwargs):
+    """go.Scatter, ou go.Scattergl (même style, rendu WebGL) pour les traces de plus de WEBGL_THRESHOLD points"""
+    n_points = len(kwargs['x']) if kwargs.get('x') is not None else 0
+    trace = go.Scattergl if n_points > WEBGL_THRESHOLD else go.Scatter
+    return trace(**kwargs)
 
-# Fonctions de visualisation - sans décorateur @st.cache_data
+# Fonctions de visualisation - figures mises en cache par chart_id et données affichées
+@cached_figure()
 def create_plotly_visualizations(df, analyzer, chart_id):
     """Crée des visualisations Plotly interactives avec ID unique"""
     
@@ -558,10 +255,13 @@ def create_plotly_visualizations(df, analyzer, chart_id):
                [{"secondary_y": False}, {"secondary_y": False}],
                [{"secondary_y": False}, {"secondary_y": False}]]
     )
+    # Grille de 2 colonnes : chaque sous-graphique occupe la moitié de la largeur
+    panel_width = CHART_WIDTH_PX // 2
+    years = df['Earth_Year']
     
     # Cycle principal
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'], y=df['Base_Value'],
+        scatter_trace(**downsampled(years, df['Base_Value'], panel_width),
                   mode='lines', name='Valeur observée',
                   line=dict(color=analyzer.config['color'], width=2),
                   hovertemplate='Année: %{x}<br>Valeur: %{y:.2f} ' + analyzer.config['unit']),
@@ -570,7 +270,7 @@ def create_plotly_visualizations(df, analyzer, chart_id):
     
     # Grande Tache Rouge
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'], y=df['Great_Red_Spot_Evolution'],
+        scatter_trace(**downsampled(years, df['Great_Red_Spot_Evolution'], panel_width),
                   mode='lines', name='Taille relative',
                   line=dict(color='#FF4500', width=2),
                   fill='tozeroy'),
@@ -579,7 +279,7 @@ def create_plotly_visualizations(df, analyzer, chart_id):
     
     # Tendance de la GTR
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'], y=[1.0] * len(df),
+        scatter_trace(x=[years.min(), years.max()], y=[1.0, 1.0],
                   mode='lines', name='Référence (1665)',
                   line=dict(color='yellow', width=1, dash='dash')),
         row=1, col=2
@@ -587,7 +287,7 @@ def create_plotly_visualizations(df, analyzer, chart_id):
     
     # Activité des tempêtes
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'], y=df['Storm_Intensity'],
+        scatter_trace(**downsampled(years, df['Storm_Intensity'], panel_width),
                   mode='lines', name='Intensité des tempêtes',
                   line=dict(color='#FFA500', width=2)),
         row=2, col=1
@@ -595,7 +295,7 @@ def create_plotly_visualizations(df, analyzer, chart_id):
     
     # Activité magnétique
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'], y=df['Magnetic_Activity'],
+        scatter_trace(**downsampled(years, df['Magnetic_Activity'], panel_width),
                   mode='lines', name='Champ magnétique',
                   line=dict(color='#1E90FF', width=2)),
         row=2, col=2
@@ -603,7 +303,7 @@ def create_plotly_visualizations(df, analyzer, chart_id):
     
     # Aurores
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'], y=df['Auroral_Power'],
+        scatter_trace(**downsampled(years, df['Auroral_Power'], panel_width),
                   mode='lines', name='Aurores',
                   line=dict(color='#00CED1', width=2, dash='dot')),
         row=2, col=2
@@ -611,32 +311,30 @@ def create_plotly_visualizations(df, analyzer, chart_id):
     
     # Données brutes vs lissées
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'], y=df['Base_Value'],
+        scatter_trace(**downsampled(years, df['Base_Value'], panel_width),
                   mode='lines', name='Données brutes',
                   line=dict(color=analyzer.config['color'], width=1, dash='dot')),
         row=3, col=1
     )
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'], y=df['Smoothed_Value'],
+        scatter_trace(**downsampled(years, df['Smoothed_Value'], panel_width),
                   mode='lines', name='Données lissées',
                   line=dict(color='#00FF7F', width=3)),
         row=3, col=1
     )
     
     # Projections futures
-    hist_mask = df['Earth_Year'] <= 2020
-    pred_mask = df['Earth_Year'] >= 2020
+    history = slice_years(df, end=2020)
+    prediction = slice_years(df, start=2020)
     
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'][hist_mask], 
-                  y=df['Base_Value'][hist_mask],
+        scatter_trace(**downsampled(history['Earth_Year'], history['Base_Value'], panel_width),
                   mode='lines', name='Historique',
                   line=dict(color=analyzer.config['color'], width=2)),
         row=3, col=2
     )
     fig_main.add_trace(
-        go.Scatter(x=df['Earth_Year'][pred_mask], 
-                  y=df['Future_Prediction'][pred_mask],
+        scatter_trace(**downsampled(prediction['Earth_Year'], prediction['Future_Prediction'], panel_width),
                   mode='lines', name='Projections',
                   line=dict(color='#00FFFF', width=2, dash='dash')),
         row=3, col=2
@@ -646,7 +344,7 @@ def create_plotly_visualizations(df, analyzer, chart_id):
         height=900,
         showlegend=True,
         template='plotly_dark',
-        title_text=f"♃ Analyse Interactive des Données Joviennes - {analyzer.config['description']}",
+        title_text=f"♃ Analyse Interactive des Données Joviennes - {analyzer.config['icon']} {analyzer.config['description']}",
         title_font_size=18,
         title_font_color='#D8CA9D',
         hovermode='x unified',
@@ -667,6 +365,7 @@ def create_plotly_visualizations(df, analyzer, chart_id):
     
     return fig_main
 
+@cached_figure()
 def create_jupiter_atmosphere_visualization(df, analyzer, chart_id):
     """Crée une visualisation de l'atmosphère de Jupiter avec ID unique"""
     
@@ -707,6 +406,8 @@ def create_jupiter_atmosphere_visualization(df, analyzer, chart_id):
     
     return fig_atmo
 
+# Positions des lunes recalculées toutes les heures
+@cached_figure(refresh_seconds=3600)
 def create_moon_orbits_visualization(chart_id):
     """Crée une visualisation des orbites des lunes galiléennes avec ID unique"""
     
@@ -722,7 +423,7 @@ def create_moon_orbits_visualization(chart_id):
         x = radius * np.cos(theta)
         y = radius * np.sin(theta)
         
-        fig_moons.add_trace(go.Scatter(
+        fig_moons.add_trace(scatter_trace(
             x=x, y=y,
             mode='lines',
             name=moon,
@@ -731,7 +432,7 @@ def create_moon_orbits_visualization(chart_id):
         ))
         
         angle = 2 * np.pi * (datetime.now().timestamp() / (periods[i] * 86400))
-        fig_moons.add_trace(go.Scatter(
+        fig_moons.add_trace(scatter_trace(
             x=[radius * np.cos(angle)],
             y=[radius * np.sin(angle)],
             mode='markers',
@@ -740,7 +441,7 @@ def create_moon_orbits_visualization(chart_id):
             hovertext=moon
         ))
     
-    fig_moons.add_trace(go.Scatter(
+    fig_moons.add_trace(scatter_trace(
         x=[0], y=[0],
         mode='markers',
         marker=dict(size=30, color='#D8CA9D', symbol='star'),
@@ -761,12 +462,13 @@ def create_moon_orbits_visualization(chart_id):
     
     return fig_moons
 
+@cached_figure()
 def create_mission_timeline(events, chart_id):
     """Crée une timeline des missions joviennes avec ID unique"""
     if not events:
         return None
     
-    df_events = pd.DataFrame(events)
+    df_events = jupiter_event_frame(events)
     
     fig_timeline = go.Figure()
     
@@ -812,14 +514,14 @@ def create_mission_timeline(events, chart_id):
     
     return fig_timeline
 
+@cached_figure()
 def create_gtr_evolution_chart(df, chart_id):
     """Crée un graphique d'évolution de la Grande Tache Rouge avec ID unique"""
     
     fig_gtr = go.Figure()
     
-    fig_gtr.add_trace(go.Scatter(
-        x=df['Earth_Year'],
-        y=df['Great_Red_Spot_Evolution'] * 16000,
+    fig_gtr.add_trace(scatter_trace(
+        **downsampled(df['Earth_Year'], df['Great_Red_Spot_Evolution'] * 16000),
         mode='lines',
         name='Diamètre',
         line=dict(color='#FF4500', width=3),
@@ -836,13 +538,13 @@ def create_gtr_evolution_chart(df, chart_id):
     
     return fig_gtr
 
+@cached_figure()
 def create_moon_influence_chart(df, chart_id):
     """Crée un graphique d'influence des lunes avec ID unique"""
     
     fig_moon_influence = go.Figure()
-    fig_moon_influence.add_trace(go.Scatter(
-        x=df['Earth_Year'],
-        y=df['Moon_Influences'],
+    fig_moon_influence.add_trace(scatter_trace(
+        **downsampled(df['Earth_Year'], df['Moon_Influences']),
         mode='lines',
         name='Influence combinée',
         line=dict(color='#DA70D6', width=2)
@@ -858,9 +560,12 @@ def create_moon_influence_chart(df, chart_id):
     
     return fig_moon_influence
 
+@cached_figure()
 def create_pie_chart_missions(df_events, chart_id):
     """Crée un diagramme circulaire des types de missions"""
+    # Les types en catégories gardent les modalités filtrées (ex. storm) avec un effectif nul
     mission_counts = df_events['type'].value_counts()
+    mission_counts = mission_counts[mission_counts > 0]
     fig_pie = go.Figure(data=[go.Pie(
         labels=mission_counts.index,
         values=mission_counts.values,
@@ -870,6 +575,7 @@ def create_pie_chart_missions(df_events, chart_id):
     fig_pie.update_layout(template='plotly_dark', height=300, title="Types de missions")
     return fig_pie
 
+@cached_figure()
 def create_distribution_chart(df, analyzer, chart_id):
     """Crée un graphique de distribution"""
     fig_dist = make_subplots(rows=2, cols=1, 
@@ -891,6 +597,51 @@ def create_distribution_chart(df, analyzer, chart_id):
     fig_dist.update_layout(template='plotly_dark', height=500, title="Distribution des données")
     return fig_dist
 
+# Exports produits uniquement au clic sur le bouton de téléchargement
+@profiled('export/csv')
+def export_csv(df):
+    """CSV écrit par blocs en mémoire, puis dans un fichier temporaire au-delà d'EXPORT_SPOOL_MAX_BYTES.
+    
+    Retourne un BytesIO ou un fichier ouvert en lecture binaire, seuls types
+    de flux acceptés par st.download_button.
+    """
+    buffer = BytesIO()
+    spill = None
+    for start in range(0, max(len(df), 1), EXPORT_CSV_CHUNK_ROWS):
+        chunk = df.iloc[start:start + EXPORT_CSV_CHUNK_ROWS]
+        (spill or buffer).write(chunk.to_csv(index=False, header=start == 0).encode())
+        if spill is None and buffer.tell() > EXPORT_SPOOL_MAX_BYTES:
+            spill = tempfile.NamedTemporaryFile(suffix='.csv', delete=False)
+            spill.write(buffer.getbuffer())
+            buffer = BytesIO()
+    if spill is None:
+        buffer.seek(0)
+        return buffer
+    
+    spill.close()
+    reader = open(spill.name, 'rb')
+    try:
+        # Sous POSIX le fichier reste lisible par reader après suppression de son nom
+        os.remove(spill.name)
+    except OSError:
+        pass
+    return reader
+
+@profiled('export/excel')
+def export_excel(df):
+    """Classeur Excel (openpyxl)"""
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='Jupiter Data')
+    return output.getvalue()
+
+@profiled('export/parquet')
+def export_parquet(df):
+    """Fichier Parquet (types de colonnes conservés)"""
+    output = BytesIO()
+    df.to_parquet(output, index=False)
+    return output.getvalue()
+
 def get_storm_class(intensity):
     """Retourne la classe CSS pour l'intensité des tempêtes"""
     if intensity < 150:
@@ -898,7 +649,8 @@ def get_storm_class(intensity):
     else:
         return "storm-high"
 
-def main():
+def render_dashboard():
+    """Affiche la page complète et retourne le jeu de données affiché"""
     st.markdown('<h1 class="main-header">♃ Jupiter - Le Roi des Planètes</h1>', unsafe_allow_html=True)
     
     with st.sidebar:
@@ -933,6 +685,15 @@ def main():
         with col2:
             end_year = st.number_input("Fin", min_value=1611, max_value=2030, value=2025, key="end_year")
         
+        resolution = st.selectbox(
+            "⏱️ Résolution temporelle",
+            options=list(DASHBOARD_RESOLUTIONS),
+            format_func=lambda x: DASHBOARD_RESOLUTIONS[x],
+            key="resolution"
+        )
+        
+        seed = st.number_input("🎲 Graine aléatoire", min_value=0, value=1610, step=1, key="seed")
+        
         show_missions = st.checkbox("Afficher les missions", value=True, key="show_missions")
         show_moons = st.checkbox("Afficher les lunes", value=True, key="show_moons")
         
@@ -942,8 +703,13 @@ def main():
             key="viz_mode"
         )
         
-        if st.button("♃ Générer l'analyse", use_container_width=True, key="generate_button"):
-            st.session_state['generate'] = True
+        # Relance le script ; les données suivent toujours les paramètres ci-dessus
+        st.button("♃ Générer l'analyse", use_container_width=True, key="generate_button")
+        
+        # Mesure par étape du rendu suivant (panneau en bas de page)
+        if st.checkbox("🩺 Diagnostics de performance", value=False, key="diagnostics"):
+            st.checkbox("Pic mémoire par étape (tracemalloc, plus lent)", value=False, key="diagnostics_memory")
+            st.checkbox("Mesurer aussi les exports", value=False, key="diagnostics_exports")
         
         st.markdown("---")
         st.markdown("### 👑 Faits royaux")
@@ -959,22 +725,16 @@ def main():
         """, unsafe_allow_html=True)
     
     # Initialisation de l'analyseur
-    analyzer = JupiterDataAnalyzer(selected_type)
+    analyzer = JupiterDataAnalyzer(selected_type, seed=int(seed), resolution=resolution)
     analyzer.start_year = start_year
     analyzer.end_year = end_year
     
-    # Génération des données - sans cache pour éviter les problèmes de hash
-    if 'generate' in st.session_state and st.session_state['generate']:
-        with st.spinner("♃ Génération des données joviennes en cours..."):
-            df = analyzer.generate_jupiter_data()
-            st.session_state['df'] = df
-            st.session_state['generate'] = False
-    elif 'df' not in st.session_state:
-        with st.spinner("♃ Chargement des données joviennes..."):
-            df = analyzer.generate_jupiter_data()
-            st.session_state['df'] = df
-    else:
-        df = st.session_state['df']
+    # Génération des données : cache partagé entre sessions, clé = paramètres de la barre latérale
+    with stage('load_jupiter_data'):
+        df, analyzer.events, memory_saved = load_jupiter_data(selected_type, int(start_year), int(end_year),
+                                                              int(seed), resolution)
+    st.sidebar.caption(f"🗜️ Données en mémoire : {frame_nbytes(df) / 1024 ** 2:.2f} Mio "
+                       f"({memory_saved / 1024 ** 2:.2f} Mio économisés par le stockage compact)")
     
     # Métriques principales avec IDs uniques
     col1, col2, col3, col4 = st.columns(4)
@@ -1020,26 +780,21 @@ def main():
         </div>
         """, unsafe_allow_html=True)
     
-    # Tabs avec clés uniques
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+    # Navigation par sections : seule la section affichée est calculée à chaque rerun
+    # (st.tabs exécuterait le contenu des six onglets)
+    sections = [
         "📈 Analyse Principale", "🌪️ Atmosphère", "🌕 Lunes", 
         "🚀 Missions", "📊 Statistiques", "🔮 Projections"
-    ])
+    ]
+    section = st.radio("Section", sections, horizontal=True,
+                       label_visibility="collapsed", key="section")
     
-    with tab1:
+    if section == sections[0]:
         st.markdown("## Visualisation Interactive")
         
         col1, col2 = st.columns([3, 1])
         with col1:
-            year_range = st.slider(
-                "Période d'affichage",
-                min_value=int(df['Earth_Year'].min()),
-                max_value=int(df['Earth_Year'].max()),
-                value=(1900, 2025),
-                key="year_range_slider"
-            )
-        
-        df_filtered = df[(df['Earth_Year'] >= year_range[0]) & (df['Earth_Year'] <= year_range[1])]
+            year_range, df_filtered = period_slider(df, "year_range_slider", default=(1900, 2025))
         
         # Générer un ID unique basé sur les paramètres
         chart_id = f"main_{selected_type}_{year_range[0]}_{year_range[1]}_{viz_mode}"
@@ -1057,7 +812,7 @@ def main():
         with st.expander("ℹ️ À propos de Jupiter", expanded=False):
             st.markdown(f"""
             <div class="info-box">
-                <h4>{analyzer.config['description']}</h4>
+                <h4>{analyzer.config['icon']} {analyzer.config['description']}</h4>
                 <p><strong>Unité:</strong> {analyzer.config['unit']}</p>
                 <p><strong>Plage typique:</strong> {analyzer.config['range'][0]} - {analyzer.config['range'][1]} {analyzer.config['unit']}</p>
                 <p><strong>Année jovienne:</strong> 11.86 années terrestres</p>
@@ -1068,7 +823,7 @@ def main():
             </div>
             """, unsafe_allow_html=True)
     
-    with tab2:
+    if section == sections[1]:
         st.markdown("## 🌪️ Atmosphère et Météo")
         
         col1, col2 = st.columns(2)
@@ -1108,10 +863,12 @@ def main():
         # Évolution de la GTR
         st.markdown("### 📈 Évolution de la Grande Tache Rouge")
         
-        fig_gtr = create_gtr_evolution_chart(df, "gtr_evolution")
+        # Pleine résolution en resserrant la période (le nombre de points tracés reste plafonné)
+        _, df_gtr = period_slider(df, "gtr_year_range")
+        fig_gtr = create_gtr_evolution_chart(df_gtr, "gtr_evolution")
         st.plotly_chart(fig_gtr, use_container_width=True, key="plot_gtr")
     
-    with tab3:
+    if section == sections[2]:
         st.markdown("## 🌕 Système Lunaire")
         
         col1, col2 = st.columns(2)
@@ -1169,10 +926,11 @@ def main():
         # Influence des lunes
         st.markdown("### 📊 Influence gravitationnelle")
         
-        fig_moon_influence = create_moon_influence_chart(df, "moon_influence")
+        _, df_moons = period_slider(df, "moon_year_range")
+        fig_moon_influence = create_moon_influence_chart(df_moons, "moon_influence")
         st.plotly_chart(fig_moon_influence, use_container_width=True, key="plot_moon_influence")
     
-    with tab4:
+    if section == sections[3]:
         st.markdown("## 🚀 Exploration Jovienne")
         
         if hasattr(analyzer, 'events') and analyzer.events:
@@ -1182,7 +940,7 @@ def main():
             
             col1, col2, col3 = st.columns(3)
             
-            df_events = pd.DataFrame(analyzer.events)
+            df_events = jupiter_event_frame(analyzer.events)
             missions_df = df_events[df_events['type'] != 'storm']
             
             with col1:
@@ -1221,7 +979,7 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
     
-    with tab5:
+    if section == sections[4]:
         st.markdown("## 📊 Statistiques Joviennes")
         
         col1, col2 = st.columns(2)
@@ -1238,8 +996,8 @@ def main():
             fig_dist = create_distribution_chart(df, analyzer, "distribution")
             st.plotly_chart(fig_dist, use_container_width=True, key="plot_distribution")
         
-        df['Century'] = (df['Earth_Year'] // 100) * 100
-        century_stats = df.groupby('Century').agg({
+        century = ((df['Earth_Year'] // 100) * 100).rename('Century')
+        century_stats = df.groupby(century).agg({
             'Base_Value': 'mean',
             'Observation_Quality': 'mean',
             'Storm_Intensity': 'mean'
@@ -1249,7 +1007,7 @@ def main():
         st.markdown("### Analyse par siècle")
         st.dataframe(century_stats, use_container_width=True)
     
-    with tab6:
+    if section == sections[5]:
         st.markdown("## 🔮 Missions Futures et Exploration")
         
         col1, col2 = st.columns(2)
@@ -1311,30 +1069,62 @@ def main():
         </div>
         """, unsafe_allow_html=True)
     
-    # Footer avec téléchargement
+    # Footer avec téléchargement (fichiers générés seulement à la demande)
     st.markdown("---")
-    col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        csv = df.to_csv(index=False)
-        b64 = base64.b64encode(csv.encode()).decode()
-        href = f'<a href="data:file/csv;base64,{b64}" download="jupiter_data.csv" style="text-decoration: none; color: #D8CA9D;">📥 Télécharger CSV</a>'
-        st.markdown(href, unsafe_allow_html=True)
+        st.download_button("📥 Télécharger CSV", data=functools.partial(export_csv, df),
+                           file_name="jupiter_data.csv", mime="text/csv",
+                           on_click="ignore", key="download_csv")
     
     with col2:
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Jupiter Data')
-        excel_data = output.getvalue()
-        b64_excel = base64.b64encode(excel_data).decode()
-        href_excel = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64_excel}" download="jupiter_data.xlsx" style="text-decoration: none; color: #D8CA9D;">📊 Télécharger Excel</a>'
-        st.markdown(href_excel, unsafe_allow_html=True)
+        st.download_button("📊 Télécharger Excel", data=functools.partial(export_excel, df),
+                           file_name="jupiter_data.xlsx",
+                           mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                           on_click="ignore", key="download_excel")
     
     with col3:
-        st.markdown('<a href="#" style="text-decoration: none; color: #D8CA9D;">📑 Rapport PDF</a>', unsafe_allow_html=True)
+        if HAS_PYARROW:
+            st.download_button("🗃️ Télécharger Parquet", data=functools.partial(export_parquet, df),
+                               file_name="jupiter_data.parquet", mime="application/vnd.apache.parquet",
+                               on_click="ignore", key="download_parquet")
     
     with col4:
+        st.markdown('<a href="#" style="text-decoration: none; color: #D8CA9D;">📑 Rapport PDF</a>', unsafe_allow_html=True)
+    
+    with col5:
         st.markdown('<span class="royal-badge">♃ Roi des Planètes</span>', unsafe_allow_html=True)
+    
+    return df
+
+def show_diagnostics(profiler):
+    """Panneau repliable : temps (et pic mémoire) de chaque étape du dernier rendu"""
+    with st.expander("🩺 Diagnostics de performance", expanded=False):
+        st.caption("Temps inclusifs du dernier rendu. Les étapes servies par les caches "
+                   "(données, figures) ne sont mesurées qu'au premier calcul.")
+        st.dataframe(profiler.summary(), hide_index=True, use_container_width=True)
+        if profiler.allocations:
+            st.markdown("**Mémoire allouée encore vivante (principaux sites)**")
+            st.dataframe(pd.DataFrame(profiler.allocations, columns=['site', 'bytes']),
+                         hide_index=True, use_container_width=True)
+
+def main():
+    """Affiche le tableau de bord, mesuré étape par étape si les diagnostics sont activés"""
+    if not st.session_state.get('diagnostics'):
+        render_dashboard()
+        return
+    
+    with Profiler(memory=st.session_state.get('diagnostics_memory', False)) as profiler:
+        with stage('dashboard'):
+            df = render_dashboard()
+        if st.session_state.get('diagnostics_exports'):
+            # Les téléchargements sont encodés au clic, hors du rendu : mesure explicite
+            for export in (export_csv, export_excel) + ((export_parquet,) if HAS_PYARROW else ()):
+                output = export(df)
+                if hasattr(output, 'close'):
+                    output.close()
+    show_diagnostics(profiler)
 
 if __name__ == "__main__":
     main()
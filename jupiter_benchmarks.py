@@ -0,0 +1,341 @@
+"""Banc de mesures reproductible : génération, événements, lissage, ensembles, figures et exports.
+
+Chaque cas est exécuté une fois pour la chauffe puis ``repeat`` fois
+chronométrées (time.perf_counter) ; une exécution supplémentaire sous
+tracemalloc mesure le pic de mémoire allouée (objets Python et tableaux
+NumPy). Les résultats sont écrits en JSON trié, sans horodatage, pour être
+comparés d'un commit à l'autre :
+
+    python jupiter_benchmarks.py -o bench.json
+    python jupiter_benchmarks.py --quick -k generation --compare bench.json
+
+Tout s'exécute hors ligne, graines fixées ; les fichiers temporaires sont
+écrits dans un répertoire supprimé à la fin.
+"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from jupiter_cache import HAS_PYARROW
+from jupiter_core import JUPITER_DATA_TYPES, JupiterDataAnalyzer, build_time_axis, generate_jupiter_batch
+from jupiter_io import OUTPUT_WRITERS, write_dataset
+from jupiter_smoothing import SMOOTHING_KERNELS, smooth_series
+
+BENCHMARK_RESOLUTIONS = ('yearly', 'monthly', 'daily')
+# 100 types = les 10 types disponibles pour 10 graines différentes
+BENCHMARK_TYPE_COUNTS = (1, 10, 100)
+BENCHMARK_ENSEMBLE_SIZES = (10, 100, 1000)
+BENCHMARK_SEED = 1610
+
+BENCHMARKS = {}
+
+
+def register_benchmark(group):
+    """Enregistre un générateur de cas cases(quick) -> (nom, paramètres, préparation).
+
+    La préparation (simulation des données, import du tableau de bord...)
+    n'est appelée qu'à l'exécution du cas, hors chronométrage ; elle retourne
+    la fonction sans argument à mesurer. Lister les cas ne coûte donc rien.
+    """
+    def decorator(cases):
+        BENCHMARKS[group] = cases
+        return cases
+    return decorator
+
+
+def _analyzer(data_type='wind_speeds', resolution='yearly', seed=BENCHMARK_SEED):
+    return JupiterDataAnalyzer(data_type, seed=seed, resolution=resolution)
+
+
+@functools.lru_cache(maxsize=None)
+def _dataset(resolution, data_type='wind_speeds'):
+    """Jeu de données de référence (sans cache disque) et son analyseur, simulé une fois par exécution"""
+    analyzer = _analyzer(data_type, resolution)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return analyzer, analyzer.generate_jupiter_data()
+
+
+def _rows(resolution):
+    """Nombre de lignes du jeu de référence, sans le simuler"""
+    analyzer = _analyzer(resolution=resolution)
+    return len(build_time_axis(analyzer.start_year, analyzer.end_year, resolution)[0])
+
+
+def _resolutions(quick):
+    return BENCHMARK_RESOLUTIONS[:2] if quick else BENCHMARK_RESOLUTIONS
+
+
+@register_benchmark('generation')
+def generation_cases(quick):
+    """generate_jupiter_data (1 type) et generate_jupiter_batch (10 et 100 types)"""
+    for resolution in _resolutions(quick):
+        for n_types in BENCHMARK_TYPE_COUNTS[:2] if quick else BENCHMARK_TYPE_COUNTS:
+            if n_types == 1:
+                def prepare(resolution=resolution):
+                    return lambda: _analyzer(resolution=resolution).generate_jupiter_data()
+            else:
+                def prepare(resolution=resolution, n_seeds=n_types // len(JUPITER_DATA_TYPES)):
+                    def run():
+                        for seed in range(BENCHMARK_SEED, BENCHMARK_SEED + n_seeds):
+                            generate_jupiter_batch(seed=seed, resolution=resolution)
+                    return run
+            yield f'generation/{resolution}/types={n_types}', {'resolution': resolution, 'types': n_types}, prepare
+
+
+@register_benchmark('events')
+def events_cases(quick):
+    """Application du catalogue d'événements historiques (_add_jupiter_events)"""
+    for resolution in _resolutions(quick):
+        def prepare(resolution=resolution):
+            analyzer, df = _dataset(resolution)
+            years = df['Earth_Year'].to_numpy()
+            columns = {column: df[column].to_numpy() for column in df.columns if column != 'Date'}
+            return lambda: analyzer._add_jupiter_events({name: values.copy() for name, values in columns.items()},
+                                                        years)
+        yield f'events/{resolution}', {'resolution': resolution, 'rows': _rows(resolution)}, prepare
+
+
+@register_benchmark('smoothing')
+def smoothing_cases(quick):
+    """Lissage de Base_Value par chaque noyau (fenêtre de 5 années terrestres)"""
+    for resolution in _resolutions(quick):
+        analyzer = _analyzer(resolution=resolution)
+        window = max(1, round(analyzer.smoothing_window * analyzer.samples_per_year))
+        for kernel in SMOOTHING_KERNELS:
+            def prepare(resolution=resolution, window=window, kernel=kernel):
+                values = _dataset(resolution)[1]['Base_Value'].to_numpy()
+                return lambda: smooth_series(values, window, kernel)
+            yield (f'smoothing/{resolution}/{kernel}',
+                   {'resolution': resolution, 'kernel': kernel, 'window': window}, prepare)
+
+
+@register_benchmark('ensemble')
+def ensemble_cases(quick):
+    """Ensembles Monte-Carlo annuels, dans un seul processus (n_jobs=1)"""
+    for size in BENCHMARK_ENSEMBLE_SIZES[:2] if quick else BENCHMARK_ENSEMBLE_SIZES:
+        def prepare(size=size):
+            return lambda: _analyzer().generate_ensemble(size, n_jobs=1)
+        yield f'ensemble/realizations={size}', {'realizations': size}, prepare
+
+
+@functools.lru_cache(maxsize=None)
+def _dashboard():
+    """Module Dashboard importé hors du serveur Streamlit (figures et exports seulement)"""
+    import logging
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        import Dashboard
+    return Dashboard
+
+
+# Figures Plotly mesurées (fonctions create_<nom> du tableau de bord)
+BENCHMARK_FIGURES = ('plotly_visualizations', 'jupiter_atmosphere_visualization', 'distribution_chart')
+
+
+@functools.lru_cache(maxsize=None)
+def _figure(name, resolution):
+    """Figure Plotly de référence et sa forme JSON"""
+    analyzer, df = _dataset(resolution)
+    fig = _figure_builder(name)(df, analyzer, 'benchmark')
+    return fig, fig.to_json()
+
+
+def _figure_builder(name):
+    # Fonction d'origine, sans le cache de figures du tableau de bord
+    return getattr(_dashboard(), f'create_{name}').__wrapped__
+
+
+@register_benchmark('figures')
+def figure_cases(quick):
+    """Figures Plotly du tableau de bord (construction, JSON, reconstruction) et figure matplotlib"""
+    for resolution in _resolutions(quick):
+        params = {'resolution': resolution, 'rows': _rows(resolution)}
+        for name in BENCHMARK_FIGURES:
+            def prepare_build(name=name, resolution=resolution):
+                build = _figure_builder(name)
+                analyzer, df = _dataset(resolution)
+                return lambda: build(df, analyzer, 'benchmark')
+
+            def prepare_serialize(name=name, resolution=resolution):
+                fig, _ = _figure(name, resolution)
+                return fig.to_json
+
+            def prepare_reload(name=name, resolution=resolution):
+                import plotly.graph_objects as go
+                _, payload = _figure(name, resolution)
+                return lambda: go.Figure(json.loads(payload), _validate=False)
+            yield f'figures/plotly/{name}/{resolution}/build', params, prepare_build
+            yield f'figures/plotly/{name}/{resolution}/to_json', params, prepare_serialize
+            yield f'figures/plotly/{name}/{resolution}/from_json', params, prepare_reload
+
+        def prepare_render(resolution=resolution):
+            from jupiter_plotting import render_jupiter_analysis
+            analyzer, df = _dataset(resolution)
+
+            def run():
+                with tempfile.TemporaryDirectory() as directory:
+                    render_jupiter_analysis(analyzer, df, os.path.join(directory, 'analysis.png'), dpi=100)
+            return run
+        yield f'figures/matplotlib/analysis/{resolution}', {**params, 'dpi': 100}, prepare_render
+
+
+@register_benchmark('export')
+def export_cases(quick):
+    """Exports du tableau de bord (CSV, Excel, Parquet) et écrivains de la ligne de commande"""
+    exports = ('csv', 'excel', 'parquet') if HAS_PYARROW else ('csv', 'excel')
+
+    for resolution in _resolutions(quick):
+        params = {'resolution': resolution, 'rows': _rows(resolution)}
+        for name in exports:
+            if name == 'excel' and resolution == 'daily':
+                continue  # openpyxl : environ une minute par exécution pour ~150 000 lignes
+
+            def prepare(name=name, resolution=resolution):
+                export = getattr(_dashboard(), f'export_{name}')
+                df = _dataset(resolution)[1]
+
+                def run():
+                    output = export(df)
+                    if hasattr(output, 'close'):
+                        output.close()
+                return run
+            yield f'export/dashboard/{name}/{resolution}', params, prepare
+        for output_format in OUTPUT_WRITERS:
+            def prepare(output_format=output_format, resolution=resolution):
+                df = _dataset(resolution)[1]
+
+                def run():
+                    with tempfile.TemporaryDirectory() as directory:
+                        write_dataset(df, directory, 'benchmark', output_format)
+                return run
+            yield f'export/cli/{output_format}/{resolution}', params, prepare
+
+
+def measure(run, repeat):
+    """Durées de repeat exécutions (après une chauffe) et pic de mémoire d'une exécution tracée"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        run()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+        # Mesure mémoire séparée : tracemalloc ralentit l'exécution
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {
+        'times_s': [round(t, 6) for t in times],
+        'min_s': round(min(times), 6),
+        'median_s': round(statistics.median(times), 6),
+        'peak_memory_bytes': peak,
+    }
+
+
+def environment():
+    """Versions et machine, pour interpréter une comparaison entre deux fichiers de résultats"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def run_benchmarks(groups=None, pattern=None, repeat=3, quick=False):
+    """Exécute les cas sélectionnés et retourne le dictionnaire de résultats (sérialisable en JSON)"""
+    results = {}
+    for group in groups or BENCHMARKS:
+        for name, params, prepare in BENCHMARKS[group](quick):
+            if pattern and pattern not in name:
+                continue
+            with contextlib.redirect_stdout(io.StringIO()):
+                run = prepare()
+            result = {'group': group, 'params': params, **measure(run, repeat)}
+            results[name] = result
+            # Progression sur la sortie d'erreur : la sortie standard peut porter le JSON
+            print(f"⏱️ {name}: {result['median_s'] * 1000:.1f} ms "
+                  f"(pic {result['peak_memory_bytes'] / 1024 ** 2:.1f} Mo)", file=sys.stderr)
+    return {'environment': environment(), 'settings': {'repeat': repeat, 'quick': quick}, 'results': results}
+
+
+def compare(current, baseline):
+    """Affiche le rapport des médianes entre deux fichiers de résultats (cas communs)"""
+    print(f"\n📊 Comparaison avec {baseline['environment'].get('commit')} "
+          f"(médiane actuelle / référence):", file=sys.stderr)
+    for name, result in current['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            continue
+        ratio = result['median_s'] / reference['median_s'] if reference['median_s'] else float('inf')
+        flag = '🔺' if ratio > 1.1 else '🔻' if ratio < 0.9 else '  '
+        print(f"{flag} {name}: {reference['median_s'] * 1000:.1f} ms -> "
+              f"{result['median_s'] * 1000:.1f} ms (x{ratio:.2f})", file=sys.stderr)
+
+
+def parse_args(argv=None):
+    """Options du banc de mesures"""
+    parser = argparse.ArgumentParser(description="♃ Banc de mesures des données joviennes")
+    parser.add_argument('-g', '--group', dest='groups', action='append', choices=list(BENCHMARKS),
+                        help="groupe de cas à exécuter (option répétable, défaut: tous)")
+    parser.add_argument('-k', dest='pattern', default=None, help="n'exécute que les cas dont le nom contient ce texte")
+    parser.add_argument('-r', '--repeat', type=int, default=3, help="exécutions chronométrées par cas (défaut: 3)")
+    parser.add_argument('--quick', action='store_true',
+                        help="sans résolution journalière, 100 types ni ensemble de 1000 réalisations")
+    parser.add_argument('-o', '--output', default=None, help="fichier JSON des résultats (défaut: sortie standard)")
+    parser.add_argument('--compare', default=None, help="fichier JSON de référence à comparer")
+    parser.add_argument('--list', action='store_true', help="liste les cas sans les exécuter")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat doit être supérieur ou égal à 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list:
+        for group in args.groups or BENCHMARKS:
+            for name, _, _ in BENCHMARKS[group](args.quick):
+                if not args.pattern or args.pattern in name:
+                    print(name)
+        return
+
+    report = run_benchmarks(args.groups, args.pattern, args.repeat, args.quick)
+    payload = json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as target:
+            target.write(payload + '\n')
+        print(f"💾 Résultats: {args.output}")
+    else:
+        sys.stdout.write(payload + '\n')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as source:
+            compare(report, json.load(source))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Cache disque adressé par contenu pour les jeux de données joviens générés.
+
+La clé d'un jeu de données est l'empreinte SHA-256 de tout ce qui le
+détermine : générateur, configuration du type, période, résolution, graine,
+options de simulation et version du code (empreinte des fichiers source).
+Les DataFrames sont stockés en Parquet (pyarrow) ou, à défaut, en .npz, et
+le répertoire est borné en taille avec éviction des entrées les moins
+récemment utilisées.
+
+FigureCache est l'équivalent en mémoire pour des figures sérialisées (JSON),
+indexées par identifiant de graphique et empreinte des données affichées.
+"""
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from jupiter_profiling import profiled
+
+# pyarrow n'est importé qu'à la première lecture ou écriture Parquet
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'JUPITER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'jupiter'))
+DEFAULT_MAX_BYTES = int(os.environ.get('JUPITER_CACHE_MAX_BYTES', 512 * 1024 ** 2))
+DEFAULT_FIGURE_MAX_BYTES = int(os.environ.get('JUPITER_FIGURE_CACHE_MAX_BYTES', 64 * 1024 ** 2))
+
+# Modules dont le code influence les données générées, en plus de celui du générateur
+_DATA_MODULES = ('jupiter_events', 'jupiter_smoothing')
+
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(path):
+    with open(path, 'rb') as source:
+        return hashlib.sha256(source.read()).hexdigest()
+
+
+def code_version(generator_class):
+    """Empreinte du code source qui produit les données (générateur et modules partagés)"""
+    modules = [generator_class.__module__] + [name for name in _DATA_MODULES if name in sys.modules]
+    digest = hashlib.sha256()
+    for name in modules:
+        path = getattr(sys.modules[name], '__file__', None)
+        if path:
+            digest.update(_file_digest(os.path.abspath(path)).encode())
+    return digest.hexdigest()
+
+
+def dataset_parameters(analyzer):
+    """Paramètres qui déterminent entièrement les données d'un analyseur (sérialisables en JSON)"""
+    generator_class = type(analyzer)
+    return {
+        'generator': f'{generator_class.__module__}.{generator_class.__qualname__}',
+        'code_version': code_version(generator_class),
+        'data_type': analyzer.data_type,
+        'config': analyzer.config,
+        'start_year': int(analyzer.start_year),
+        'end_year': int(analyzer.end_year),
+        'seed': str(analyzer.seed),
+        'resolution': getattr(analyzer, 'resolution', 'yearly'),
+        'smoothing': [getattr(analyzer, 'smoothing_window', None), getattr(analyzer, 'smoothing_kernel', None)],
+        'vectorized': getattr(analyzer, 'vectorized', True),
+    }
+
+
+def dataset_key(analyzer):
+    """Clé de cache d'un analyseur : hash des paramètres qui déterminent entièrement ses données"""
+    payload = json.dumps(dataset_parameters(analyzer), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class DatasetCache:
+    """Répertoire de DataFrames indexés par clé, borné en taille (éviction LRU)"""
+
+    def __init__(self, directory=None, max_bytes=None):
+        self.directory = Path(directory or DEFAULT_CACHE_DIR)
+        self.max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self.extension = '.parquet' if HAS_PYARROW else '.npz'
+
+    def _path(self, key, extension=None):
+        return self.directory / f'{key}{extension or self.extension}'
+
+    @profiled('cache/get')
+    def get(self, key):
+        """Retourne le DataFrame associé à la clé, ou None s'il n'est pas en cache"""
+        for extension in ('.parquet', '.npz'):
+            path = self._path(key, extension)
+            if not path.exists() or (extension == '.parquet' and not HAS_PYARROW):
+                continue
+            try:
+                df = _read_parquet(path) if extension == '.parquet' else load_npz(path)
+            except (OSError, ValueError, KeyError):
+                # Entrée corrompue ou écrite par une autre version : on l'ignore
+                path.unlink(missing_ok=True)
+                continue
+            # La date de modification sert d'horodatage LRU
+            os.utime(path)
+            return df
+        return None
+
+    @profiled('cache/put')
+    def put(self, key, df):
+        """Enregistre le DataFrame (écriture atomique) puis applique la limite de taille.
+        
+        Le cache est facultatif : un répertoire absent, non inscriptible ou
+        plein est signalé sur stderr sans interrompre l'appelant.
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=self.extension + '.tmp')
+            os.close(descriptor)
+            try:
+                if self.extension == '.parquet':
+                    df.to_parquet(temporary, index=False)
+                else:
+                    save_npz(temporary, df)
+                os.replace(temporary, path)
+            finally:
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+            self._evict(keep=path)
+        except OSError as error:
+            print(f"⚠️ Cache disque indisponible, jeu de données non enregistré: {error}", file=sys.stderr)
+
+    def _evict(self, keep=None):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_bytes"""
+        entries = []
+        for path in self.directory.iterdir():
+            if path.suffix in ('.parquet', '.npz'):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        """Vide le cache"""
+        if self.directory.exists():
+            for path in self.directory.iterdir():
+                if path.suffix in ('.parquet', '.npz'):
+                    path.unlink(missing_ok=True)
+
+
+def frame_fingerprint(df):
+    """Empreinte du contenu d'un DataFrame (valeurs, index et noms de colonnes)"""
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    digest.update(json.dumps([str(column) for column in df.columns]).encode())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Figures sérialisées en mémoire, bornées en octets (éviction LRU), partageables entre threads"""
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = DEFAULT_FIGURE_MAX_BYTES if max_bytes is None else max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Retourne la figure sérialisée associée à la clé, ou None"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key, payload):
+        """Enregistre une figure sérialisée puis évince les plus anciennes au-delà de max_bytes"""
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = payload
+            self._size += len(payload)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        """Vide le cache"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def _read_parquet(path):
+    df = pd.read_parquet(path)
+    # Parquet ne stocke pas les secondes : retour à l'unité des dates générées
+    for column in df.select_dtypes('datetime').columns:
+        df[column] = df[column].astype('datetime64[s]')
+    return df
+
+
+def save_npz(path, df, metadata=None, compress=False):
+    """Archive NumPy d'un DataFrame : une entrée par colonne, l'ordre des colonnes et, si fournies, les métadonnées JSON"""
+    arrays = {}
+    for column in df.columns:
+        values = df[column].to_numpy()
+        # Les colonnes texte (ex. Data_Type, catégories) sont stockées en unicode numpy, sans pickle
+        arrays[column] = values.astype(str) if values.dtype == object else values
+    if metadata is not None:
+        arrays['__metadata__'] = np.array(json.dumps(metadata, default=str))
+    save = np.savez_compressed if compress else np.savez
+    with open(path, 'wb') as target:
+        save(target, __columns__=np.array(df.columns, dtype=str), **arrays)
+
+
+def load_npz(path):
+    """DataFrame d'une archive écrite par save_npz (métadonnées ignorées)"""
+    with np.load(path, allow_pickle=False) as archive:
+        return pd.DataFrame({column: archive[column] for column in archive['__columns__']})
@@ -0,0 +1,1205 @@
+"""Moteur de simulation des données joviennes, partagé par Jupiter.py et Dashboard.py.
+
+Ce module n'importe que NumPy et pandas (et les modules jupiter_* de
+données) : l'import reste rapide pour la ligne de commande comme pour
+chaque processus Streamlit. Les figures matplotlib sont dans
+jupiter_plotting, importé seulement quand une figure est demandée.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from jupiter_events import JUPITER_EVENTS, apply_jupiter_events, jupiter_event_log
+from jupiter_smoothing import SMOOTHING_KERNELS, smooth_series
+from jupiter_cache import dataset_key
+from jupiter_profiling import profiled, stage
+
+# Résolutions temporelles : unité numpy datetime64 du pas et nombre moyen d'échantillons par an
+RESOLUTIONS = {
+    'yearly': ('Y', 1),
+    'monthly': ('M', 12),
+    'daily': ('D', 365.2425),
+    'hourly': ('h', 365.2425 * 24),
+}
+
+# Axes temporels, jamais convertis en float32 : l'année décimale horaire demande ~1e-4 an de résolution
+TIME_COLUMNS = ('Earth_Year', 'Jupiter_Year', 'Date')
+
+def build_time_axis(start_year, end_year, resolution='yearly'):
+    """Construit l'axe temporel [start_year, end_year] : (années décimales, dates datetime64 ou None).
+
+    En résolution annuelle l'axe reste une suite d'années entières. Sinon on
+    parcourt le calendrier (mois, jours ou heures) et chaque instant est
+    converti en année décimale : année + fraction écoulée de l'année civile.
+    """
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Résolution inconnue: {resolution} (choix: {', '.join(RESOLUTIONS)})")
+    if resolution == 'yearly':
+        return np.arange(start_year, end_year + 1), None
+    
+    unit = RESOLUTIONS[resolution][0]
+    dates = np.arange(np.datetime64(f'{start_year:04d}-01-01', unit),
+                      np.datetime64(f'{end_year + 1:04d}-01-01', unit),
+                      dtype=f'datetime64[{unit}]')
+    year_start = dates.astype('datetime64[Y]')
+    elapsed = dates - year_start.astype(dates.dtype)
+    year_length = (year_start + 1).astype(dates.dtype) - year_start.astype(dates.dtype)
+    years = year_start.astype(np.int64) + 1970 + elapsed / year_length
+    return years, dates.astype('datetime64[s]')
+
+def year_bounds(years, start=None, end=None):
+    """Positions [lo, hi) des instants de years (trié) compris dans [start, end], par recherche dichotomique"""
+    years = np.asarray(years)
+    lo = 0 if start is None else int(np.searchsorted(years, start, side='left'))
+    hi = len(years) if end is None else int(np.searchsorted(years, end, side='right'))
+    return lo, hi
+
+# Clé de DataFrame.attrs : Earth_Year croissant, vérifié une fois à la construction du DataFrame
+TIME_SORTED_ATTR = 'time_sorted'
+
+def mark_time_sorted(df, time_sorted=None):
+    """Note dans df.attrs si Earth_Year est croissant (parcours de la colonne si time_sorted est None)"""
+    if time_sorted is None:
+        time_sorted = bool(df['Earth_Year'].is_monotonic_increasing)
+    df.attrs[TIME_SORTED_ATTR] = time_sorted
+    return time_sorted
+
+def slice_years(df, start=None, end=None):
+    """Lignes d'un DataFrame généré dont Earth_Year est dans [start, end] (bornes incluses, None = ouverte).
+    
+    Earth_Year est trié par construction (build_time_axis) : la période est
+    trouvée par recherche dichotomique et retournée comme tranche de lignes,
+    qui partage les données de df au lieu de construire des masques booléens
+    et une copie. L'ordre est lu dans df.attrs, posé par les générateurs (ou
+    vérifié au premier appel pour un autre DataFrame) ; un DataFrame non trié
+    (ex. format long de generate_jupiter_batch, un bloc par type) lève
+    ValueError.
+    """
+    time_sorted = df.attrs.get(TIME_SORTED_ATTR)
+    if time_sorted is None:
+        time_sorted = mark_time_sorted(df)
+    if not time_sorted:
+        raise ValueError("slice_years demande un Earth_Year croissant (un seul type de données par DataFrame)")
+    lo, hi = year_bounds(df['Earth_Year'].to_numpy(), start, end)
+    return df.iloc[lo:hi]
+
+# Politiques de stockage des DataFrames générés (voir apply_dtype_policy)
+DTYPE_POLICIES = ('float64', 'compact')
+
+def apply_dtype_policy(df, policy='float64'):
+    """Retourne le DataFrame avec les types de stockage de la politique : 'float64' (inchangé) ou 'compact'.
+    
+    En mode compact, les mesures passent en float32, Earth_Year entier
+    (résolution annuelle) en int16 ou int32 et les colonnes texte (ex.
+    Data_Type du format long) en catégories. Les axes temporels décimaux
+    restent en float64.
+    """
+    if policy not in DTYPE_POLICIES:
+        raise ValueError(f"Politique de types inconnue: {policy} (choix: {', '.join(DTYPE_POLICIES)})")
+    if policy == 'float64':
+        return df
+    
+    columns = {}
+    for column in df.columns:
+        values = df[column].to_numpy()
+        if column == 'Earth_Year' and values.dtype.kind in 'iu':
+            fits_int16 = len(values) == 0 or (values.min() >= np.iinfo(np.int16).min and
+                                              values.max() <= np.iinfo(np.int16).max)
+            columns[column] = values.astype(np.int16 if fits_int16 else np.int32)
+        elif column in TIME_COLUMNS:
+            columns[column] = values
+        elif values.dtype == np.float64:
+            columns[column] = values.astype(np.float32)
+        elif pd.api.types.is_string_dtype(df[column].dtype):
+            columns[column] = df[column].astype('category')
+        else:
+            columns[column] = values
+    # Construction en une fois : les colonnes float32 forment un seul bloc
+    compact = pd.DataFrame(columns, index=df.index)
+    compact.attrs.update(df.attrs)
+    return compact
+
+def frame_nbytes(df):
+    """Mémoire occupée par un DataFrame (contenu des chaînes compris)"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+# Types de données joviennes disponibles
+JUPITER_DATA_TYPES = [
+    "atmospheric_temperature", "wind_speeds", "great_red_spot", "magnetic_field",
+    "radiation_belts", "auroral_activity", "ring_system", "moons_activity",
+    "atmospheric_composition", "orbital_parameters"
+]
+class JupiterDataAnalyzer:
+    # Graphe des colonnes générées : colonne -> (simulateur, colonnes dont il dépend).
+    # Chaque série intermédiaire est calculée une seule fois par génération puis
+    # transmise aux colonnes dérivées (Smoothed_Value lisse bien Base_Value).
+    COLUMN_GRAPH = {
+        'Jupiter_Year': ('earth_to_jupiter_years', ()),
+        'Solar_Distance': ('simulate_solar_distance', ()),
+        
+        # Données principales basées sur les cycles joviens
+        'Base_Value': ('simulate_jupiter_cycle', ()),
+        'Seasonal_Variation': ('simulate_seasonal_variation', ()),
+        'Atmospheric_Storms': ('simulate_atmospheric_storms', ()),
+        'Magnetic_Activity': ('simulate_magnetic_activity', ()),
+        
+        # Variations spécifiques à Jupiter
+        'Great_Red_Spot_Evolution': ('simulate_great_red_spot', ()),
+        'Radiation_Variations': ('simulate_radiation_variations', ()),
+        'Moon_Influences': ('simulate_moon_influences', ()),
+        
+        # Données dérivées
+        'Smoothed_Value': ('simulate_smoothed_data', ('Base_Value',)),
+        'Short_Term_Variation': ('simulate_short_term_variation', ()),
+        'Long_Term_Trend': ('simulate_long_term_trend', ()),
+        
+        # Indices joviens complémentaires
+        'Jupiter_Index': ('simulate_jupiter_index', ('Base_Value', 'Atmospheric_Storms', 'Magnetic_Activity')),
+        'Observation_Quality': ('simulate_observation_quality', ()),
+        'Future_Prediction': ('simulate_future_prediction', ('Base_Value', 'Long_Term_Trend')),
+        
+        # Intensité des tempêtes et puissance aurorale (tableau de bord)
+        'Storm_Intensity': ('simulate_storm_intensity', ('Atmospheric_Storms',)),
+        'Auroral_Power': ('simulate_auroral_power', ()),
+    }
+    
+    # Colonnes qui ne dépendent pas de la configuration du type de données :
+    # identiques pour tous les types, calculées une seule fois en génération groupée
+    TYPE_INDEPENDENT_COLUMNS = (
+        'Jupiter_Year', 'Solar_Distance', 'Seasonal_Variation', 'Atmospheric_Storms',
+        'Magnetic_Activity', 'Great_Red_Spot_Evolution', 'Radiation_Variations',
+        'Moon_Influences', 'Short_Term_Variation', 'Observation_Quality',
+        'Storm_Intensity', 'Auroral_Power',
+    )
+    
+    # Colonnes bruitées : chacune tire dans son propre flux numpy.random.Generator,
+    # issu de SeedSequence(seed).spawn(). Ne pas réordonner (ajouter à la fin).
+    NOISE_STREAMS = ('Base_Value', 'Future_Prediction', 'Storm_Intensity')
+    
+    # Schéma complet, connu avant la simulation : colonnes du graphe puis colonnes
+    # que seuls les événements renseignent (ex. Moons_Activity, NaN hors événements)
+    EVENT_ONLY_COLUMNS = tuple(sorted(set(JUPITER_EVENTS['column']) - set(COLUMN_GRAPH)))
+    DATA_COLUMNS = tuple(COLUMN_GRAPH) + EVENT_ONLY_COLUMNS
+    
+    def __init__(self, data_type, vectorized=True, seed=None,
+                 smoothing_window=5, smoothing_kernel='moving_average', resolution='yearly',
+                 cache=None, dtype_policy='float64'):
+        self.data_type = data_type
+        # Moteur vectorisé NumPy par défaut ; False = boucles année par année (référence)
+        self.vectorized = vectorized
+        self.colors = ['#D8CA9D', '#B8A86D', '#9B8E64', '#C9B27C', '#E0D0A8',
+                      '#A8996D', '#D4C49E', '#F0E6C8', '#8C7C5E', '#B5A885']
+        
+        self.start_year = 1610  # Découverte des lunes galiléennes
+        self.end_year = 2025
+        
+        # Configuration spécifique pour chaque type de données joviennes
+        self.config = self._get_jupiter_config()
+        
+        # Graine du générateur aléatoire : (data_type, start_year, end_year, seed)
+        # détermine entièrement le DataFrame généré
+        self.seed = np.random.SeedSequence().entropy if seed is None else seed
+        
+        # Lissage de Smoothed_Value : fenêtre centrée (années terrestres) et noyau
+        # parmi SMOOTHING_KERNELS (moyenne glissante, exponentiel, gaussien, Savitzky–Golay)
+        if smoothing_kernel not in SMOOTHING_KERNELS:
+            raise ValueError(f"Noyau de lissage inconnu: {smoothing_kernel}")
+        self.smoothing_window = smoothing_window
+        self.smoothing_kernel = smoothing_kernel
+        
+        # Pas de temps : 'yearly', 'monthly', 'daily' ou 'hourly'
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Résolution inconnue: {resolution}")
+        self.resolution = resolution
+        
+        # Cache disque (jupiter_cache.DatasetCache) consulté avant toute simulation
+        self.cache = cache
+        
+        # Types de stockage du DataFrame retourné ('float64' ou 'compact', voir
+        # apply_dtype_policy) ; le cache disque garde toujours la pleine précision
+        if dtype_policy not in DTYPE_POLICIES:
+            raise ValueError(f"Politique de types inconnue: {dtype_policy}")
+        self.dtype_policy = dtype_policy
+        # Octets économisés par la politique de types sur le dernier DataFrame retourné
+        self.memory_saved = 0
+        
+    def _get_jupiter_config(self):
+        """Retourne la configuration spécifique pour chaque type de données joviennes"""
+        configs = {
+            "atmospheric_temperature": {
+                "base_value": -145,
+                "cycle_years": 11.86,  # Année jovienne
+                "amplitude": 20,
+                "trend": "stable",
+                "unit": "°C",
+                "description": "Température atmosphérique",
+                "icon": "🌡️",
+                "color": "#B8A86D",
+                "range": [-165, -125]
+            },
+            "wind_speeds": {
+                "base_value": 150,
+                "cycle_years": 11.86,
+                "amplitude": 100,
+                "trend": "jet_streams",
+                "unit": "km/h",
+                "description": "Vitesse des vents",
+                "icon": "💨",
+                "color": "#C9B27C",
+                "range": [50, 600]
+            },
+            "great_red_spot": {
+                "base_value": 16000,
+                "cycle_years": 11.86,
+                "amplitude": 2000,
+                "trend": "shrinking",
+                "unit": "km diamètre",
+                "description": "Grande Tache Rouge",
+                "icon": "🔴",
+                "color": "#FF4500",
+                "range": [14000, 18000]
+            },
+            "magnetic_field": {
+                "base_value": 4200000,
+                "cycle_years": 11.86,
+                "amplitude": 100000,
+                "trend": "stable",
+                "unit": "nT",
+                "description": "Champ magnétique",
+                "icon": "🧲",
+                "color": "#9B8E64",
+                "range": [4000000, 4300000]
+            },
+            "radiation_belts": {
+                "base_value": 3500,
+                "cycle_years": 11.86,
+                "amplitude": 500,
+                "trend": "variable",
+                "unit": "rads/h",
+                "description": "Ceintures de radiation",
+                "icon": "☢️",
+                "color": "#FFD700",
+                "range": [3000, 4000]
+            },
+            "auroral_activity": {
+                "base_value": 80,
+                "cycle_years": 11.86,
+                "amplitude": 40,
+                "trend": "solar_dependent",
+                "unit": "intensité",
+                "description": "Activité aurorale",
+                "icon": "✨",
+                "color": "#00CED1",
+                "range": [40, 120]
+            },
+            "ring_system": {
+                "base_value": 30,
+                "cycle_years": 11.86,
+                "amplitude": 5,
+                "trend": "stable",
+                "unit": "albédo",
+                "description": "Système d'anneaux",
+                "icon": "💫",
+                "color": "#E0D0A8",
+                "range": [25, 35]
+            },
+            "moons_activity": {
+                "base_value": 65,
+                "cycle_years": 11.86,
+                "amplitude": 20,
+                "trend": "volcanic",
+                "unit": "index",
+                "description": "Activité des lunes",
+                "icon": "🌕",
+                "color": "#DA70D6",
+                "range": [45, 85]
+            },
+            "atmospheric_composition": {
+                "base_value": 90,
+                "cycle_years": 11.86,
+                "amplitude": 5,
+                "trend": "stable",
+                "unit": "% hydrogène",
+                "description": "Composition atmosphérique",
+                "icon": "🧪",
+                "color": "#A8996D",
+                "range": [85, 95]
+            },
+            "orbital_parameters": {
+                "base_value": 5.20,
+                "cycle_years": 11.86,
+                "amplitude": 0.20,
+                "trend": "stable",
+                "unit": "UA",
+                "description": "Distance au Soleil",
+                "icon": "🛸",
+                "color": "#B5A885",
+                "range": [5.00, 5.40]
+            },
+            # Configuration par défaut
+            "default": {
+                "base_value": 100,
+                "cycle_years": 11.86,
+                "amplitude": 20,
+                "trend": "stable",
+                "unit": "Unités",
+                "description": "Données joviennes génériques",
+                "icon": "♃",
+                "color": "#D8CA9D",
+                "range": [60, 140]
+            }
+        }
+        
+        return configs.get(self.data_type, configs["default"])
+    
+    @profiled('generate_jupiter_data')
+    def generate_jupiter_data(self):
+        """Génère des données joviennes simulées basées sur les caractéristiques uniques de Jupiter"""
+        cache_key = dataset_key(self) if self.cache is not None else None
+        if cache_key is not None:
+            df = self.cache.get(cache_key)
+            if df is not None:
+                print(f"♃ Données joviennes chargées depuis le cache pour {self.config['description']}")
+                self.events = jupiter_event_log(df['Earth_Year'], df['Jupiter_Year'])
+                mark_time_sorted(df)
+                return self._apply_dtype_policy(df)
+        
+        print(f"♃ Génération des données joviennes pour {self.config['description']}...")
+        df = self._simulate_dataset()
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, df)
+        return self._apply_dtype_policy(df)
+    
+    def _apply_dtype_policy(self, df):
+        """Applique self.dtype_policy et note la mémoire économisée dans self.memory_saved"""
+        if self.dtype_policy == 'float64':
+            self.memory_saved = 0
+            return df
+        with stage('dtype_policy'):
+            compact = apply_dtype_policy(df, self.dtype_policy)
+        self.memory_saved = frame_nbytes(df) - frame_nbytes(compact)
+        return compact
+    
+    def _simulate_dataset(self):
+        """Simule toutes les colonnes puis applique les événements historiques"""
+        # Axe temporel en années terrestres (décimales hors résolution annuelle)
+        # Les dates numpy (datetime64[s]) n'ont pas l'overflow des dates pandas en ns
+        years, dates = build_time_axis(self.start_year, self.end_year, self.resolution)
+        
+        # Chaque simulateur écrit sa colonne dans une ligne du bloc préalloué
+        block = self._allocate_block(len(years))
+        series = self._resolve_columns(years if self.vectorized else years.tolist(), out=block)
+        
+        if not self.vectorized:
+            df = self._assemble_frame(block, years, dates)
+            self._add_jupiter_events_scalar(df)
+            return df
+        
+        # Ajouter des événements joviens historiques (sur place, à travers les vues du bloc)
+        self._add_jupiter_events(series, years)
+        
+        return self._assemble_frame(block, years, dates)
+    
+    def _allocate_block(self, length):
+        """Bloc float64 (DATA_COLUMNS, instants) ; les colonnes d'événements partent de NaN"""
+        block = np.empty((len(self.DATA_COLUMNS), length))
+        block[len(self.COLUMN_GRAPH):] = np.nan
+        return block
+    
+    def _assemble_frame(self, block, years, dates=None):
+        """DataFrame qui enveloppe le bloc sans copie, précédé des axes temporels"""
+        with stage('dataframe'):
+            # block.T a la disposition d'un bloc pandas (colonnes, lignes) : aucune copie
+            df = pd.DataFrame(block.T, columns=list(self.DATA_COLUMNS), copy=False)
+            if dates is not None:
+                df.insert(0, 'Date', dates)
+            df.insert(0, 'Earth_Year', years)
+        # Axe construit croissant : slice_years n'a pas à le vérifier
+        mark_time_sorted(df, True)
+        return df
+    
+    @profiled('generate_ensemble')
+    def generate_ensemble(self, n_realizations=1000, percentiles=(5, 50, 95), n_jobs=None):
+        """Génère un ensemble Monte-Carlo et retourne les bandes de percentiles.
+        
+        Chaque réalisation i utilise sa propre graine, dérivée de self.seed, et
+        reproduit exactement Base_Value et Future_Prediction de
+        JupiterDataAnalyzer(data_type, seed=graine_i).generate_jupiter_data().
+        Les réalisations sont calculées par lots sous forme de matrices
+        (réalisations, instants), répartis sur n_jobs processus (tous les
+        cœurs par défaut). Toutes les réalisations sont gardées en mémoire
+        pour le calcul exact des percentiles.
+        Retourne un DataFrame avec Earth_Year et les colonnes
+        Base_Value_P5, Base_Value_P50, ..., Future_Prediction_P95.
+        """
+        print(f"♃ Ensemble de {n_realizations} réalisations pour {self.config['description']}...")
+        seeds = [int(seed) for seed in
+                 np.random.SeedSequence(self.seed).generate_state(n_realizations, dtype=np.uint64)]
+        n_jobs = min(n_jobs or os.cpu_count() or 1, n_realizations)
+        settings = (self.data_type, self.start_year, self.end_year, self.resolution)
+        bounds = np.linspace(0, n_realizations, n_jobs + 1).astype(int)
+        batches = [seeds[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+        
+        if n_jobs == 1:
+            results = [_ensemble_realizations(settings, batch) for batch in batches]
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                results = list(executor.map(_ensemble_realizations, [settings] * n_jobs, batches))
+        
+        years, dates = build_time_axis(self.start_year, self.end_year, self.resolution)
+        bands = {'Earth_Year': years} if dates is None else {'Earth_Year': years, 'Date': dates}
+        for index, column in enumerate(('Base_Value', 'Future_Prediction')):
+            realizations = np.concatenate([result[index] for result in results])
+            for q, band in zip(percentiles, np.percentile(realizations, percentiles, axis=0)):
+                bands[f'{column}_P{q:g}'] = band
+        return pd.DataFrame(bands)
+    
+    @property
+    def samples_per_year(self):
+        """Nombre moyen d'échantillons par année terrestre pour la résolution choisie"""
+        return RESOLUTIONS[self.resolution][1]
+    
+    def _resolve_columns(self, years, columns=None, known=None, out=None):
+        """Calcule les colonnes du graphe une seule fois chacune, dépendances d'abord.
+        
+        ``known`` fournit des séries déjà calculées (ex. colonnes communes à
+        plusieurs types) qui ne sont pas recalculées. Avec ``out`` (bloc de
+        _allocate_block), chaque colonne calculée est écrite dans sa ligne du
+        bloc et la série retournée est une vue de cette ligne.
+        """
+        series = dict(known or {})
+        self._rngs = self._spawn_generators()
+        rows = {name: row for row, name in enumerate(self.DATA_COLUMNS)}
+        if out is not None:
+            # Colonnes renseignées par les seuls événements : vues des lignes à NaN
+            series.update({name: out[rows[name]] for name in self.EVENT_ONLY_COLUMNS if name not in series})
+        
+        def resolve(name):
+            if name not in series:
+                method, dependencies = self.COLUMN_GRAPH[name]
+                inputs = [resolve(dependency) for dependency in dependencies]
+                with stage(f'simulate/{name}'):
+                    values = self._simulator(method)(years, *inputs)
+                if out is not None:
+                    out[rows[name]] = values
+                    values = out[rows[name]] if self.vectorized else values
+                series[name] = values
+            return series[name]
+        
+        for name in (self.COLUMN_GRAPH if columns is None else columns):
+            resolve(name)
+        return series
+    
+    def _spawn_generators(self, seed=None):
+        """Crée un générateur indépendant par colonne bruitée à partir de la graine"""
+        seed = self.seed if seed is None else seed
+        children = np.random.SeedSequence(seed).spawn(len(self.NOISE_STREAMS))
+        return {name: np.random.default_rng(child) for name, child in zip(self.NOISE_STREAMS, children)}
+    
+    def _simulator(self, name):
+        """Retourne le simulateur vectorisé, ou sa version scalaire si vectorized=False"""
+        suffix = '' if self.vectorized else '_scalar'
+        return getattr(self, f'_{name}{suffix}')
+    
+    # ------------------------------------------------------------------
+    # Simulateurs vectorisés : chaque colonne est une expression NumPy
+    # sur le tableau complet des années (mêmes formules que les versions
+    # scalaires ci-dessous, dans le même ordre d'opérations).
+    # ------------------------------------------------------------------
+    
+    def _earth_to_jupiter_years(self, years):
+        """Convertit les années terrestres en années joviennes"""
+        jupiter_year_duration = 11.86  # Années terrestres
+        return (np.asarray(years) - self.start_year) / jupiter_year_duration
+    
+    def _simulate_solar_distance(self, years):
+        """Simule la distance au Soleil"""
+        elapsed = np.asarray(years) - self.start_year
+        # Distance moyenne de Jupiter : 5.20 UA
+        base_distance = 5.20
+        # Légère variation due à l'excentricité orbitale
+        variation = 0.05 * np.sin(2 * np.pi * elapsed / 11.86)
+        return base_distance + variation
+    
+    def _simulate_jupiter_cycle(self, years):
+        """Simule le cycle jovien principal"""
+        signal = self._jupiter_cycle_signal(years)
+        return signal + self._jupiter_cycle_noise(len(signal))
+    
+    def _jupiter_cycle_noise(self, size):
+        """Bruit naturel jovien, tiré dans le flux de Base_Value"""
+        return self._rngs['Base_Value'].normal(0, self.config["amplitude"] * 0.1, size=size)
+    
+    def _jupiter_cycle_signal(self, years):
+        """Partie déterministe du cycle jovien principal (sans bruit)"""
+        base_value = self.config["base_value"]
+        cycle_years = self.config["cycle_years"]
+        amplitude = self.config["amplitude"]
+        elapsed = np.asarray(years) - self.start_year
+        
+        # Cycle saisonnier jovien (11.86 années terrestres)
+        seasonal_cycle = np.sin(2 * np.pi * (elapsed % cycle_years) / cycle_years)
+        
+        if self.config["trend"] == "jet_streams":
+            # Cycle des taches (environ 10-15 ans terrestres)
+            spot_cycle_years = 12.5
+            spot_cycle = np.cos(2 * np.pi * (elapsed % spot_cycle_years) / spot_cycle_years)
+            values = base_value + amplitude * (0.6 * seasonal_cycle + 0.4 * spot_cycle)
+        elif self.config["trend"] == "shrinking":
+            # Tendance à la réduction pour la Grande Tache Rouge
+            shrinkage = -0.01 * elapsed
+            values = base_value + amplitude * seasonal_cycle + shrinkage
+        elif self.config["trend"] == "solar_dependent":
+            # Cycle solaire influençant Jupiter
+            solar_cycle_years = 11.0
+            solar_cycle = np.sin(2 * np.pi * (elapsed % solar_cycle_years) / solar_cycle_years)
+            values = base_value + amplitude * (0.7 * solar_cycle + 0.3 * seasonal_cycle)
+        elif self.config["trend"] == "volcanic":
+            # Activité volcanique des lunes (cycle irrégulier)
+            volcanic_cycle = np.sin(2 * np.pi * elapsed / 7.3)
+            values = base_value + amplitude * volcanic_cycle
+        else:
+            values = base_value + amplitude * seasonal_cycle
+        
+        return values
+    
+    def _simulate_seasonal_variation(self, years):
+        """Simule les variations saisonnières (faibles sur Jupiter)"""
+        elapsed = np.asarray(years) - self.start_year
+        # Variation saisonnière faible (axe peu incliné)
+        seasonal_variation = 0.1 * np.sin(2 * np.pi * elapsed / 11.86)
+        return 1 + seasonal_variation
+    
+    def _simulate_atmospheric_storms(self, years):
+        """Simule l'activité des tempêtes atmosphériques"""
+        elapsed = np.asarray(years) - self.start_year
+        # Cycles de tempêtes multiples
+        short_cycle = np.sin(2 * np.pi * elapsed / 3.2)
+        medium_cycle = np.cos(2 * np.pi * elapsed / 7.5)
+        long_cycle = np.sin(2 * np.pi * elapsed / 15.8)
+        return 1.0 + 0.3 * short_cycle + 0.2 * medium_cycle + 0.1 * long_cycle
+    
+    def _simulate_magnetic_activity(self, years):
+        """Simule l'activité magnétique"""
+        elapsed = np.asarray(years) - self.start_year
+        # Cycle magnétique lié à la rotation rapide
+        magnetic_cycle = np.sin(2 * np.pi * elapsed / 9.7)
+        return 1.0 + 0.2 * magnetic_cycle
+    
+    def _simulate_great_red_spot(self, years):
+        """Simule l'évolution de la Grande Tache Rouge"""
+        years = np.asarray(years)
+        
+        # Réduction graduelle documentée (plus grande historiquement)
+        size_factor = np.select(
+            [years < 1800, years < 1900, years < 2000],
+            [1.8, 1.5, 1.2],
+            default=1.0 - 0.001 * (years - 2000)
+        )
+        
+        # Variations à court terme
+        short_term = 0.1 * np.sin(2 * np.pi * (years - self.start_year) / 5.3)
+        return size_factor * (1 + short_term)
+    
+    def _simulate_radiation_variations(self, years):
+        """Simule les variations des ceintures de radiation"""
+        elapsed = np.asarray(years) - self.start_year
+        # Influencé par le vent solaire et l'activité magnétique
+        solar_cycle = np.sin(2 * np.pi * elapsed / 11.0)
+        magnetic_cycle = np.cos(2 * np.pi * elapsed / 9.7)
+        return 1.0 + 0.3 * solar_cycle + 0.2 * magnetic_cycle
+    
+    def _simulate_moon_influences(self, years):
+        """Simule les influences des lunes galiléennes"""
+        elapsed = np.asarray(years) - self.start_year
+        # Cycles des principales lunes
+        io_cycle = np.sin(2 * np.pi * elapsed / 1.77)  # Io
+        europa_cycle = np.cos(2 * np.pi * elapsed / 3.55)  # Europe
+        ganymede_cycle = np.sin(2 * np.pi * elapsed / 7.15)  # Ganymède
+        callisto_cycle = np.cos(2 * np.pi * elapsed / 16.69)  # Callisto
+        return 1.0 + 0.15 * io_cycle + 0.1 * europa_cycle + 0.05 * ganymede_cycle + 0.03 * callisto_cycle
+    
+    def _simulate_smoothed_data(self, years, base_cycle):
+        """Simule des données lissées à partir du cycle de base déjà calculé"""
+        # Fenêtre centrée en années terrestres (convertie en échantillons), tronquée aux bords
+        window = max(1, round(self.smoothing_window * self.samples_per_year))
+        return smooth_series(base_cycle, window, self.smoothing_kernel)
+    
+    def _simulate_short_term_variation(self, years):
+        """Simule les variations à court terme"""
+        elapsed = np.asarray(years) - self.start_year
+        # Variation rapide due à la rotation (9.9 heures) - ajustée pour l'échelle annuelle
+        rapid_variation = 0.05 * np.sin(2 * np.pi * elapsed / 0.1)  # Ajusté
+        return 1 + rapid_variation
+    
+    def _simulate_long_term_trend(self, years):
+        """Simule les tendances à long terme"""
+        elapsed = np.asarray(years) - self.start_year
+        
+        if self.config["trend"] == "shrinking":
+            return 1.0 - 0.0005 * elapsed  # Réduction lente
+        return 1.0 + 0.0001 * elapsed  # Stabilité générale
+    
+    def _simulate_jupiter_index(self, years, base_cycle, storm_activity, magnetic_activity):
+        """Simule un indice jovien composite"""
+        
+        # Indice composite pondéré
+        return (base_cycle * 0.4 +
+                storm_activity * 30 * 0.3 +
+                magnetic_activity * 1000 * 0.3)
+    
+    def _simulate_observation_quality(self, years):
+        """Simule la qualité d'observation (0-100)"""
+        years = np.asarray(years)
+        
+        # Amélioration progressive des techniques d'observation
+        quality = np.select(
+            [years < 1700, years < 1800, years < 1900, years < 1970, years < 1990],
+            [10, 20, 40, 60, 80],
+            default=95
+        )
+        
+        # Variation due à la position orbitale
+        orbital_variation = 5 * np.sin(2 * np.pi * (years - self.start_year) / 11.86)
+        return np.minimum(100, quality + orbital_variation)
+    
+    def _simulate_future_prediction(self, years, base_cycle, long_term_trend):
+        """Simule des prédictions futures"""
+        years = np.asarray(years)
+        
+        predictions = base_cycle.copy()
+        future = np.floor(years) > 2020  # Période de prédiction (à partir de 2021)
+        
+        # Ajouter une incertitude croissante
+        uncertainty = 0.02 * (years[future] - 2020)
+        predictions[future] = (base_cycle[future] * long_term_trend[future] *
+                               (1 + self._rngs['Future_Prediction'].normal(0, uncertainty)))
+        return predictions
+    
+    def _simulate_storm_intensity(self, years, storm_activity):
+        """Simule l'intensité des tempêtes à partir de l'activité atmosphérique (positive)"""
+        noise = self._rngs['Storm_Intensity'].normal(0, 10, size=len(storm_activity))
+        return np.maximum(0, storm_activity * 100 + noise)
+    
+    def _simulate_auroral_power(self, years):
+        """Simule la puissance des aurores (vent solaire et cycle magnétique)"""
+        elapsed = np.asarray(years) - self.start_year
+        solar_cycle = np.sin(2 * np.pi * elapsed / 11.0)
+        magnetic_cycle = np.cos(2 * np.pi * elapsed / 9.7)
+        return 100 * (1 + 0.3 * solar_cycle + 0.2 * magnetic_cycle)
+    
+    # ------------------------------------------------------------------
+    # Versions scalaires (boucle année par année), conservées pour
+    # comparer avec le moteur vectorisé : JupiterDataAnalyzer(..., vectorized=False)
+    # ------------------------------------------------------------------
+    
+    def _earth_to_jupiter_years_scalar(self, years):
+        """Convertit les années terrestres en années joviennes"""
+        jupiter_years = []
+        jupiter_year_duration = 11.86  # Années terrestres
+        
+        for earth_year in years:
+            jupiter_year = (earth_year - self.start_year) / jupiter_year_duration
+            jupiter_years.append(jupiter_year)
+        
+        return jupiter_years
+    
+    def _simulate_solar_distance_scalar(self, years):
+        """Simule la distance au Soleil"""
+        distances = []
+        for earth_year in years:
+            # Distance moyenne de Jupiter : 5.20 UA
+            base_distance = 5.20
+            # Légère variation due à l'excentricité orbitale
+            variation = 0.05 * np.sin(2 * np.pi * (earth_year - self.start_year) / 11.86)
+            distance = base_distance + variation
+            distances.append(distance)
+        
+        return distances
+    
+    def _simulate_jupiter_cycle_scalar(self, years):
+        """Simule le cycle jovien principal"""
+        base_value = self.config["base_value"]
+        cycle_years = self.config["cycle_years"]
+        amplitude = self.config["amplitude"]
+        
+        values = []
+        for earth_year in years:
+            # Cycle saisonnier jovien (11.86 années terrestres)
+            jupiter_phase = (earth_year - self.start_year) % cycle_years
+            seasonal_cycle = np.sin(2 * np.pi * jupiter_phase / cycle_years)
+            
+            # Cycle des taches (environ 10-15 ans terrestres)
+            spot_cycle_years = 12.5
+            spot_phase = (earth_year - self.start_year) % spot_cycle_years
+            spot_cycle = np.cos(2 * np.pi * spot_phase / spot_cycle_years)
+            
+            # Cycle solaire influençant Jupiter
+            solar_cycle_years = 11.0
+            solar_phase = (earth_year - self.start_year) % solar_cycle_years
+            solar_cycle = np.sin(2 * np.pi * solar_phase / solar_cycle_years)
+            
+            if self.config["trend"] == "jet_streams":
+                value = base_value + amplitude * (0.6 * seasonal_cycle + 0.4 * spot_cycle)
+            elif self.config["trend"] == "shrinking":
+                # Tendance à la réduction pour la Grande Tache Rouge
+                years_since_start = earth_year - self.start_year
+                shrinkage = -0.01 * years_since_start
+                value = base_value + amplitude * seasonal_cycle + shrinkage
+            elif self.config["trend"] == "solar_dependent":
+                value = base_value + amplitude * (0.7 * solar_cycle + 0.3 * seasonal_cycle)
+            elif self.config["trend"] == "volcanic":
+                # Activité volcanique des lunes (cycle irrégulier)
+                volcanic_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 7.3)
+                value = base_value + amplitude * volcanic_cycle
+            else:
+                value = base_value + amplitude * seasonal_cycle
+            
+            # Bruit naturel jovien
+            noise = self._rngs['Base_Value'].normal(0, amplitude * 0.1)
+            values.append(value + noise)
+        
+        return values
+    
+    def _simulate_seasonal_variation_scalar(self, years):
+        """Simule les variations saisonnières (faibles sur Jupiter)"""
+        variations = []
+        for earth_year in years:
+            # Variation saisonnière faible (axe peu incliné)
+            seasonal_variation = 0.1 * np.sin(2 * np.pi * (earth_year - self.start_year) / 11.86)
+            variations.append(1 + seasonal_variation)
+        
+        return variations
+    
+    def _simulate_atmospheric_storms_scalar(self, years):
+        """Simule l'activité des tempêtes atmosphériques"""
+        storm_activities = []
+        for earth_year in years:
+            # Cycles de tempêtes multiples
+            short_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 3.2)
+            medium_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 7.5)
+            long_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 15.8)
+            
+            storm_activity = 1.0 + 0.3 * short_cycle + 0.2 * medium_cycle + 0.1 * long_cycle
+            storm_activities.append(storm_activity)
+        
+        return storm_activities
+    
+    def _simulate_magnetic_activity_scalar(self, years):
+        """Simule l'activité magnétique"""
+        magnetic_activities = []
+        for earth_year in years:
+            # Cycle magnétique lié à la rotation rapide
+            magnetic_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 9.7)
+            magnetic_activity = 1.0 + 0.2 * magnetic_cycle
+            magnetic_activities.append(magnetic_activity)
+        
+        return magnetic_activities
+    
+    def _simulate_great_red_spot_scalar(self, years):
+        """Simule l'évolution de la Grande Tache Rouge"""
+        spot_evolutions = []
+        for earth_year in years:
+            years_since_start = earth_year - self.start_year
+            
+            # Réduction graduelle documentée
+            if earth_year < 1800:
+                size_factor = 1.8  # Plus grande historiquement
+            elif earth_year < 1900:
+                size_factor = 1.5
+            elif earth_year < 2000:
+                size_factor = 1.2
+            else:
+                size_factor = 1.0 - 0.001 * (earth_year - 2000)
+            
+            # Variations à court terme
+            short_term = 0.1 * np.sin(2 * np.pi * (earth_year - self.start_year) / 5.3)
+            spot_evolution = size_factor * (1 + short_term)
+            spot_evolutions.append(spot_evolution)
+        
+        return spot_evolutions
+    
+    def _simulate_radiation_variations_scalar(self, years):
+        """Simule les variations des ceintures de radiation"""
+        radiation_levels = []
+        for earth_year in years:
+            # Influencé par le vent solaire et l'activité magnétique
+            solar_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 11.0)
+            magnetic_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 9.7)
+            
+            radiation_level = 1.0 + 0.3 * solar_cycle + 0.2 * magnetic_cycle
+            radiation_levels.append(radiation_level)
+        
+        return radiation_levels
+    
+    def _simulate_moon_influences_scalar(self, years):
+        """Simule les influences des lunes galiléennes"""
+        moon_influences = []
+        for earth_year in years:
+            # Cycles des principales lunes
+            io_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 1.77)  # Io
+            europa_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 3.55)  # Europe
+            ganymede_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 7.15)  # Ganymède
+            callisto_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 16.69)  # Callisto
+            
+            moon_influence = 1.0 + 0.15 * io_cycle + 0.1 * europa_cycle + 0.05 * ganymede_cycle + 0.03 * callisto_cycle
+            moon_influences.append(moon_influence)
+        
+        return moon_influences
+    
+    def _simulate_smoothed_data_scalar(self, years, base_cycle):
+        """Simule des données lissées à partir du cycle de base déjà calculé"""
+        if self.smoothing_kernel != 'moving_average':
+            # Pas de référence scalaire pour les autres noyaux
+            window = max(1, round(self.smoothing_window * self.samples_per_year))
+            return list(smooth_series(base_cycle, window, self.smoothing_kernel))
+        
+        smoothed = []
+        window_size = max(1, round(self.smoothing_window * self.samples_per_year))
+        
+        for i in range(len(base_cycle)):
+            start_idx = max(0, i - window_size//2)
+            end_idx = min(len(base_cycle), i + window_size//2 + 1)
+            window = base_cycle[start_idx:end_idx]
+            smoothed.append(np.mean(window))
+        
+        return smoothed
+    
+    def _simulate_short_term_variation_scalar(self, years):
+        """Simule les variations à court terme"""
+        variations = []
+        for earth_year in years:
+            # Variation rapide due à la rotation (9.9 heures) - ajustée pour l'échelle annuelle
+            rapid_variation = 0.05 * np.sin(2 * np.pi * (earth_year - self.start_year) / 0.1)  # Ajusté
+            variations.append(1 + rapid_variation)
+        
+        return variations
+    
+    def _simulate_long_term_trend_scalar(self, years):
+        """Simule les tendances à long terme"""
+        trends = []
+        for earth_year in years:
+            years_since_start = earth_year - self.start_year
+            
+            if self.config["trend"] == "shrinking":
+                trend = 1.0 - 0.0005 * years_since_start  # Réduction lente
+            else:
+                trend = 1.0 + 0.0001 * years_since_start  # Stabilité générale
+            
+            trends.append(trend)
+        
+        return trends
+    
+    def _simulate_jupiter_index_scalar(self, years, base_cycle, storm_activity, magnetic_activity):
+        """Simule un indice jovien composite"""
+        indices = []
+        
+        for i in range(len(years)):
+            # Indice composite pondéré
+            index = (base_cycle[i] * 0.4 + 
+                    storm_activity[i] * 30 * 0.3 +
+                    magnetic_activity[i] * 1000 * 0.3)
+            indices.append(index)
+        
+        return indices
+    
+    def _simulate_observation_quality_scalar(self, years):
+        """Simule la qualité d'observation (0-100)"""
+        qualities = []
+        for earth_year in years:
+            # Amélioration progressive des techniques d'observation
+            if earth_year < 1700:
+                quality = 10
+            elif earth_year < 1800:
+                quality = 20
+            elif earth_year < 1900:
+                quality = 40
+            elif earth_year < 1970:
+                quality = 60
+            elif earth_year < 1990:
+                quality = 80
+            else:
+                quality = 95
+            
+            # Variation due à la position orbitale
+            orbital_variation = 5 * np.sin(2 * np.pi * (earth_year - self.start_year) / 11.86)
+            qualities.append(min(100, quality + orbital_variation))
+        
+        return qualities
+    
+    def _simulate_future_prediction_scalar(self, years, base_cycle, long_term_trend):
+        """Simule des prédictions futures"""
+        predictions = []
+        
+        for i, earth_year in enumerate(years):
+            current_value = base_cycle[i]
+            trend_factor = long_term_trend[i]
+            
+            if np.floor(earth_year) > 2020:  # Période de prédiction
+                # Ajouter une incertitude croissante
+                years_since_2020 = earth_year - 2020
+                uncertainty = 0.02 * years_since_2020
+                prediction = current_value * trend_factor * (1 + self._rngs['Future_Prediction'].normal(0, uncertainty))
+            else:
+                prediction = current_value
+            
+            predictions.append(prediction)
+        
+        return predictions
+    
+    def _simulate_storm_intensity_scalar(self, years, storm_activity):
+        """Simule l'intensité des tempêtes à partir de l'activité atmosphérique (positive)"""
+        intensities = []
+        for activity in storm_activity:
+            intensity = activity * 100 + self._rngs['Storm_Intensity'].normal(0, 10)
+            intensities.append(max(0, intensity))
+        
+        return intensities
+    
+    def _simulate_auroral_power_scalar(self, years):
+        """Simule la puissance des aurores (vent solaire et cycle magnétique)"""
+        powers = []
+        for earth_year in years:
+            base_power = 100
+            solar_cycle = np.sin(2 * np.pi * (earth_year - self.start_year) / 11.0)
+            magnetic_cycle = np.cos(2 * np.pi * (earth_year - self.start_year) / 9.7)
+            
+            power = base_power * (1 + 0.3 * solar_cycle + 0.2 * magnetic_cycle)
+            powers.append(power)
+        
+        return powers
+    
+    @profiled('events')
+    def _add_jupiter_events(self, series, years):
+        """Ajoute les événements joviens historiques du catalogue partagé aux séries générées"""
+        apply_jupiter_events(series, years)
+        self.events = jupiter_event_log(years, series['Jupiter_Year'])
+    
+    @profiled('events')
+    def _add_jupiter_events_scalar(self, df):
+        """Ajoute les événements du catalogue ligne par ligne (version scalaire de référence)"""
+        for i, row in df.iterrows():
+            earth_year = np.floor(row['Earth_Year'])
+            for effect in JUPITER_EVENTS[JUPITER_EVENTS['year'] == earth_year].itertuples():
+                if effect.operation == 'set':
+                    df.loc[i, effect.column] = effect.value
+                else:
+                    df.loc[i, effect.column] *= effect.value
+        self.events = jupiter_event_log(df['Earth_Year'], df['Jupiter_Year'])
+    
+    def create_jupiter_analysis(self, df, show=True, output_dir='.', insights=True,
+                                dpi=300, image_format='png', data_path=None):
+        """Crée une analyse complète des données joviennes (show=False : rendu sans pyplot ni affichage)"""
+        # matplotlib n'est chargé qu'à la première figure
+        from jupiter_plotting import create_jupiter_analysis
+        create_jupiter_analysis(self, df, show=show, output_dir=output_dir, dpi=dpi,
+                                image_format=image_format, data_path=data_path)
+        
+        # Générer les insights
+        if insights:
+            self._generate_jupiter_insights(df)
+    
+    def render_jupiter_analysis(self, df, path, dpi=300, data_path=None):
+        """Enregistre la figure d'analyse sans état pyplot global ; voir jupiter_plotting.render_jupiter_analysis"""
+        from jupiter_plotting import render_jupiter_analysis
+        return render_jupiter_analysis(self, df, path, dpi=dpi, data_path=data_path)
+    
+    def _generate_jupiter_insights(self, df):
+        """Génère des insights analytiques sur les données joviennes"""
+        print(f"♃ INSIGHTS ANALYTIQUES - {self.config['description']}")
+        print("=" * 70)
+        
+        # 1. Statistiques de base
+        print("\n1. 📊 STATISTIQUES FONDAMENTALES:")
+        avg_value = df['Base_Value'].mean()
+        max_value = df['Base_Value'].max()
+        min_value = df['Base_Value'].min()
+        current_value = df['Base_Value'].iloc[-1]
+        
+        print(f"Valeur moyenne: {avg_value:.2f} {self.config['unit']}")
+        print(f"Valeur maximale: {max_value:.2f} {self.config['unit']}")
+        print(f"Valeur minimale: {min_value:.2f} {self.config['unit']}")
+        print(f"Valeur actuelle: {current_value:.2f} {self.config['unit']}")
+        
+        # 2. Caractéristiques physiques
+        print("\n2. 🪐 CARACTÉRISTIQUES PHYSIQUES:")
+        print("• Masse: 317.8 × Terre (1.898 × 10²⁷ kg)")
+        print("• Diamètre: 139,820 km (11 × Terre)")
+        print("• Gravité: 24.79 m/s² (2.5 × Terre)")
+        print("• Période de rotation: 9.9 heures (la plus rapide)")
+        print("• Période orbitale: 11.86 années terrestres")
+        
+        # 3. Atmosphère et climat
+        print("\n3. 🌪️ ATMOSPHÈRE ET CLIMAT:")
+        print("• Composition: 90% H₂, 10% He (+ traces)")
+        print("• Température: -145°C (niveau des nuages)")
+        print("• Vents: jusqu'à 600 km/h (courants-jets)")
+        print("• Pression: très élevée (noyau à 100 millions bars)")
+        
+        # 4. Système magnétique
+        print("\n4. 🧲 SYSTÈME MAGNÉTIQUE:")
+        print("• Champ magnétique: 20,000 × Terre (le plus puissant)")
+        print("• Magnétosphère: plus grande structure du système solaire")
+        print("• Aurores: les plus intenses observées")
+        print("• Ceintures de radiation: dangereuses pour l'électronique")
+        
+        # 5. Lunes et anneaux
+        print("\n5. 🌕 SYSTÈME DE LUNES ET ANNEAUX:")
+        print("• Lunes connues: 95 (dont 4 galiléennes)")
+        print("• Io: volcans les plus actifs du système solaire")
+        print("• Europe: océan souterrain potentiellement habitable")
+        print("• Anneaux: ténus, découverts par Voyager 1")
+        
+        # 6. Exploration historique
+        print("\n6. 🚀 HISTORIQUE D'EXPLORATION:")
+        print("• 1610: Galilée découvre les 4 lunes principales")
+        print("• 1973: Pioneer 10 - premier survol")
+        print("• 1979: Voyager 1 et 2 - découvertes majeures")
+        print("• 1995-2003: Galileo - première mission en orbite")
+        print("• 2016-présent: Juno - étude de la structure interne")
+        
+        # 7. Découvertes scientifiques majeures
+        print("\n7. 🔍 DÉCOUVERTES MAJEURES:")
+        print("• Grande Tache Rouge: tempête anticyclonique séculaire")
+        print("• Anneaux joviens: système d'anneaux ténu")
+        print("• Volcanisme sur Io: alimenté par les forces de marée")
+        print("• Océan sur Europe: sous une couche de glace")
+        print("• Champ magnétique complexe: asymétrique et puissant")
+        
+        # 8. Défis et perspectives
+        print("\n8. 🔮 DÉFIS ET PERSPECTIVES:")
+        print("• Radiation intense: défi pour les missions")
+        print("• Mission Europa Clipper: étude de l'habitabilité")
+        print("• JUICE (ESA): étude de Ganymède, Callisto, Europe")
+        print("• Recherche de vie: dans les lunes océaniques")
+        print("• Exploration humaine: lointaine mais envisagée")
+
+def _ensemble_realizations(settings, seeds):
+    """Calcule un lot de réalisations (matrices Base_Value et Future_Prediction), exécutable dans un processus"""
+    data_type, start_year, end_year, resolution = settings
+    analyzer = JupiterDataAnalyzer(data_type, resolution=resolution)
+    analyzer.start_year, analyzer.end_year = start_year, end_year
+    years, _ = build_time_axis(start_year, end_year, resolution)
+    
+    # Parties déterministes communes à toutes les réalisations
+    signal = analyzer._jupiter_cycle_signal(years)
+    trend = analyzer._simulate_long_term_trend(years)
+    
+    realizations = {'Base_Value': np.empty((len(seeds), len(years))),
+                    'Future_Prediction': np.empty((len(seeds), len(years)))}
+    for row, seed in enumerate(seeds):
+        analyzer._rngs = analyzer._spawn_generators(seed)
+        base = signal + analyzer._jupiter_cycle_noise(len(years))
+        realizations['Base_Value'][row] = base
+        realizations['Future_Prediction'][row] = analyzer._simulate_future_prediction(years, base, trend)
+    
+    events = JUPITER_EVENTS[JUPITER_EVENTS['column'].isin(list(realizations))]
+    apply_jupiter_events(realizations, years, events)
+    return realizations['Base_Value'], realizations['Future_Prediction']
+
+@profiled('generate_jupiter_batch')
+def generate_jupiter_batch(data_types=None, long_format=False, seed=None, start_year=None, end_year=None,
+                           **analyzer_options):
+    """Génère plusieurs types de données joviennes en une seule passe.
+    
+    Les colonnes indépendantes du type (distance, tempêtes, magnétisme,
+    radiation, lunes, qualité d'observation...) sont simulées une seule fois
+    et partagées (avec vectorized=False, le moteur scalaire de référence
+    simule chaque type seul). Chaque DataFrame est identique à celui qu'aurait produit
+    JupiterDataAnalyzer(type, seed=seed, ...).generate_jupiter_data().
+    Les types déjà présents dans le cache (option cache=DatasetCache())
+    sont relus au lieu d'être simulés. start_year et end_year fixent la
+    période de tous les types (défaut : celle de JupiterDataAnalyzer).
+    Retourne un dict type -> DataFrame, ou un seul DataFrame au format long
+    (colonne Data_Type) si long_format=True, avec les types de stockage de
+    l'option dtype_policy.
+    """
+    data_types = list(JUPITER_DATA_TYPES if data_types is None else data_types)
+    dtype_policy = analyzer_options.get('dtype_policy', 'float64')
+    seed = np.random.SeedSequence().entropy if seed is None else seed
+    analyzers = {data_type: JupiterDataAnalyzer(data_type, seed=seed, **analyzer_options)
+                 for data_type in data_types}
+    # Période commune (par défaut celle de JupiterDataAnalyzer)
+    for analyzer in analyzers.values():
+        if start_year is not None:
+            analyzer.start_year = start_year
+        if end_year is not None:
+            analyzer.end_year = end_year
+    
+    # Les types déjà en cache ne sont pas resimulés
+    frames = {}
+    cache_keys = {}
+    for data_type, analyzer in list(analyzers.items()):
+        if analyzer.cache is None:
+            continue
+        cache_keys[data_type] = dataset_key(analyzer)
+        df = analyzer.cache.get(cache_keys[data_type])
+        if df is not None:
+            mark_time_sorted(df)
+            frames[data_type] = df
+            analyzer.events = jupiter_event_log(df['Earth_Year'], df['Jupiter_Year'])
+            del analyzers[data_type]
+    if not analyzers:
+        return _batch_result(frames, data_types, long_format, dtype_policy)
+    
+    reference = next(iter(analyzers.values()))
+    if not reference.vectorized:
+        # Moteur scalaire (référence, listes Python) : pas de colonnes partagées, chaque type est simulé seul
+        for data_type, analyzer in analyzers.items():
+            frames[data_type] = analyzer._simulate_dataset()
+            if data_type in cache_keys:
+                analyzer.cache.put(cache_keys[data_type], frames[data_type])
+        return _batch_result(frames, data_types, long_format, dtype_policy)
+    
+    print(f"♃ Génération groupée de {len(analyzers)} types de données joviennes...")
+    
+    years, dates = build_time_axis(reference.start_year, reference.end_year, reference.resolution)
+    
+    # Colonnes communes (avant événements : les colonnes dérivées les utilisent brutes),
+    # y compris les colonnes que seuls les événements renseignent
+    shared_names = JupiterDataAnalyzer.TYPE_INDEPENDENT_COLUMNS
+    shared = reference._resolve_columns(years, shared_names)
+    shared.update({name: np.full(len(years), np.nan) for name in JupiterDataAnalyzer.EVENT_ONLY_COLUMNS})
+    
+    # Colonnes propres à chaque type, écrites directement dans le bloc de son DataFrame
+    blocks = {}
+    typed_series = {}
+    for data_type, analyzer in analyzers.items():
+        blocks[data_type] = analyzer._allocate_block(len(years))
+        series = analyzer._resolve_columns(years, known=shared, out=blocks[data_type])
+        typed_series[data_type] = {name: values for name, values in series.items() if name not in shared}
+    
+    # Événements : une fois pour les colonnes communes, puis par type pour les autres
+    shared_events = (JUPITER_EVENTS['column'].isin(shared_names) |
+                     ~JUPITER_EVENTS['column'].isin(list(JupiterDataAnalyzer.COLUMN_GRAPH)))
+    with stage('events'):
+        apply_jupiter_events(shared, years, JUPITER_EVENTS[shared_events])
+        events = jupiter_event_log(years, shared['Jupiter_Year'])
+    shared_rows = [row for row, name in enumerate(JupiterDataAnalyzer.DATA_COLUMNS) if name in shared]
+    shared_block = np.stack([shared[JupiterDataAnalyzer.DATA_COLUMNS[row]] for row in shared_rows])
+    
+    for data_type, analyzer in analyzers.items():
+        with stage('events'):
+            apply_jupiter_events(typed_series[data_type], years, JUPITER_EVENTS[~shared_events])
+        blocks[data_type][shared_rows] = shared_block
+        frames[data_type] = analyzer._assemble_frame(blocks[data_type], years, dates)
+        analyzer.events = events
+        if data_type in cache_keys:
+            analyzer.cache.put(cache_keys[data_type], frames[data_type])
+    
+    return _batch_result(frames, data_types, long_format, dtype_policy)
+
+def _batch_result(frames, data_types, long_format, dtype_policy='float64'):
+    """Met les DataFrames d'un lot dans l'ordre demandé, en dict ou au format long"""
+    frames = {data_type: apply_dtype_policy(frames[data_type], dtype_policy) for data_type in data_types}
+    if long_format:
+        long = (pd.concat(frames, names=['Data_Type', None])
+                .reset_index(level='Data_Type')
+                .reset_index(drop=True))
+        # Un bloc par type : Earth_Year n'est pas croissant sur l'ensemble (refusé par slice_years)
+        mark_time_sorted(long, False)
+        return apply_dtype_policy(long, dtype_policy)
+    return frames
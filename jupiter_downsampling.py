@@ -0,0 +1,65 @@
+"""Sous-échantillonnage des séries temporelles pour l'affichage.
+
+Un écran ne montre guère plus d'un point par pixel : au-delà, les traces
+envoyées au navigateur sont réduites à ``max_points`` points qui conservent
+la forme visuelle de la courbe (Largest-Triangle-Three-Buckets, ou minimum
+et maximum de chaque intervalle). Le premier et le dernier point sont
+toujours conservés.
+"""
+import numpy as np
+
+DOWNSAMPLING_METHODS = ('lttb', 'minmax')
+
+
+def downsample_indices(x, y, max_points, method='lttb'):
+    """Indices (croissants) des points à conserver pour tracer au plus max_points points"""
+    n = len(y)
+    if max_points is None or n <= max_points or max_points < 3:
+        return np.arange(n)
+    if method == 'lttb':
+        return lttb_indices(x, y, max_points)
+    if method == 'minmax':
+        return minmax_indices(y, max_points)
+    raise ValueError(f"Méthode de sous-échantillonnage inconnue: {method} (choix: {', '.join(DOWNSAMPLING_METHODS)})")
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets : un point par intervalle, celui qui maximise l'aire du triangle"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    # Intervalles intérieurs : les extrémités forment leurs propres intervalles
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    # Moyenne de chaque intervalle (sommet C du triangle pour l'intervalle précédent)
+    mean_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    mean_x = np.append(mean_x[1:], x[-1])
+    mean_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        area = np.abs((x[a] - mean_x[bucket]) * (y[start:stop] - y[a])
+                      - (x[a] - x[start:stop]) * (mean_y[bucket] - y[a]))
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[bucket + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_out):
+    """Minimum et maximum de chaque intervalle (n_out // 2 intervalles), dans l'ordre temporel"""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    n_buckets = max((n_out - 2) // 2, 1)
+    edges = np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+    owners = np.repeat(np.arange(n_buckets), np.diff(edges))
+    # Tri par (intervalle, valeur) : premier et dernier élément de chaque intervalle
+    order = np.lexsort((np.nan_to_num(y[1:-1], nan=np.inf), owners))
+    starts = edges[:-1] - 1
+    stops = edges[1:] - 2
+    lows = order[starts] + 1
+    highs = order[stops] + 1
+    return np.unique(np.concatenate(([0], lows, highs, [n - 1])))
@@ -0,0 +1,143 @@
+"""Catalogue des événements joviens partagé par Jupiter.py et Dashboard.py.
+
+Chaque ligne décrit un effet d'un événement sur une colonne générée :
+l'année, la colonne, l'opération ("set" ou "multiply"), la valeur, puis le
+type, la sévérité et le libellé de l'événement. Le catalogue est appliqué
+aux séries par indexation vectorisée : le coût dépend du nombre
+d'événements, pas du nombre d'années simulées.
+"""
+import numpy as np
+import pandas as pd
+
+EVENT_COLUMNS = ['year', 'column', 'operation', 'value', 'type', 'severity', 'event']
+
+_MISSION_EFFECTS = [
+    # Galilée découvre les lunes galiléennes
+    (1610, 'Observation_Quality', 'set', 15, 'discovery', 'historique', "Galilée - Découverte des lunes galiléennes"),
+    (1610, 'Moons_Activity', 'set', 50, 'discovery', 'historique', "Galilée - Découverte des lunes galiléennes"),
+    # Première observation de la Grande Tache Rouge (taille initiale)
+    (1665, 'Great_Red_Spot_Evolution', 'set', 1.8, 'observation', 'majeur', "Première observation de la Grande Tache Rouge"),
+    # Observations détaillées des bandes atmosphériques
+    (1831, 'Observation_Quality', 'set', 30, 'observation', 'majeur', "Observations détaillées des bandes"),
+    # Pioneer 10 - premier survol, découverte des ceintures
+    (1973, 'Observation_Quality', 'set', 70, 'flyby', 'historique', "Pioneer 10 - Premier survol"),
+    (1973, 'Radiation_Variations', 'set', 1.5, 'flyby', 'historique', "Pioneer 10 - Premier survol"),
+    # Voyager 1 et 2 : tempêtes détaillées, volcans sur Io
+    (1979, 'Observation_Quality', 'set', 85, 'flyby', 'historique', "Voyager 1/2 - Découvertes majeures"),
+    (1979, 'Atmospheric_Storms', 'set', 1.8, 'flyby', 'historique', "Voyager 1/2 - Découvertes majeures"),
+    (1979, 'Moons_Activity', 'set', 80, 'flyby', 'historique', "Voyager 1/2 - Découvertes majeures"),
+    # Galileo - insertion orbitale, données approfondies
+    (1995, 'Observation_Quality', 'set', 95, 'orbiter', 'historique', "Galileo - Première orbite"),
+    (1995, 'Base_Value', 'multiply', 1.3, 'orbiter', 'historique', "Galileo - Première orbite"),
+    # Cassini et New Horizons survolent Jupiter
+    (2000, 'Observation_Quality', 'set', 90, 'flyby', 'majeur', "Cassini - Survol vers Saturne"),
+    (2007, 'Observation_Quality', 'set', 92, 'flyby', 'majeur', "New Horizons - Survol vers Pluton"),
+    # Juno arrive en orbite : champ magnétique complexe
+    (2016, 'Observation_Quality', 'set', 98, 'orbiter', 'historique', "Juno - Arrivée en orbite polaire"),
+    (2016, 'Magnetic_Activity', 'set', 1.4, 'orbiter', 'historique', "Juno - Arrivée en orbite polaire"),
+    (2016, 'Base_Value', 'multiply', 1.5, 'orbiter', 'historique', "Juno - Arrivée en orbite polaire"),
+    # Observations du télescope James Webb
+    (2021, 'Observation_Quality', 'set', 99, 'telescope', 'majeur', "James Webb - Observations"),
+]
+
+# Grandes tempêtes documentées
+_STORM_EFFECTS = [
+    effect
+    for year in [1990, 2006, 2012, 2016, 2020]
+    for effect in [
+        (year, 'Atmospheric_Storms', 'multiply', 1.5, 'storm', 'majeur', "🌪️ Grande tempête atmosphérique"),
+        (year, 'Jupiter_Index', 'multiply', 1.2, 'storm', 'majeur', "🌪️ Grande tempête atmosphérique"),
+    ]
+]
+
+JUPITER_EVENTS = pd.DataFrame(_MISSION_EFFECTS + _STORM_EFFECTS, columns=EVENT_COLUMNS)
+
+
+def event_row_positions(years, event_years):
+    """Indices des lignes couvertes par chaque année d'événement, via recherche dichotomique.
+
+    Un événement de l'année N couvre les instants de [N, N + 1) ; ``years``
+    doit être trié. Retourne (indices des lignes, indice de l'événement
+    correspondant à chaque ligne).
+    """
+    years = np.asarray(years)
+    event_years = np.asarray(event_years)
+    starts = np.searchsorted(years, event_years, side='left')
+    stops = np.searchsorted(years, event_years + 1, side='left')
+    lengths = stops - starts
+    owners = np.repeat(np.arange(len(event_years)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return starts[owners] + offsets, owners
+
+
+def apply_jupiter_events(columns, years, events=JUPITER_EVENTS):
+    """Applique le catalogue d'événements aux séries ``columns`` (dict colonne -> ndarray).
+
+    Les séries sont modifiées sur place ; leur dernier axe est le temps, ce
+    qui permet aussi d'appliquer le catalogue à une matrice de réalisations.
+    Une colonne visée mais absente (ex. Moons_Activity) est créée à NaN.
+    Pour une même colonne et une même année, les "set" passent avant les
+    "multiply", et plusieurs "multiply" se composent.
+    """
+    effects = _combine_effects(events)
+    length = len(years)
+
+    for operation in ('set', 'multiply'):
+        for (effect_operation, column), per_year in effects.items():
+            if effect_operation != operation:
+                continue
+            rows, owners = event_row_positions(years, np.fromiter(per_year, dtype=np.int64))
+            if len(rows) == 0:
+                continue
+            if column not in columns:
+                reference = next(iter(columns.values()))
+                columns[column] = np.full(reference.shape[:-1] + (length,), np.nan)
+            values = np.fromiter(per_year.values(), dtype=float)[owners]
+            if operation == 'set':
+                columns[column][..., rows] = values
+            else:
+                columns[column][..., rows] *= values
+    return columns
+
+
+def _combine_effects(events):
+    """Regroupe les effets par (opération, colonne) : dernier "set" et produit des "multiply" par année"""
+    effects = {}
+    for year, column, operation, value in events[['year', 'column', 'operation', 'value']].itertuples(index=False):
+        per_year = effects.setdefault((operation, column), {})
+        if operation == 'multiply':
+            per_year[year] = per_year.get(year, 1.0) * value
+        else:
+            per_year[year] = value
+    return effects
+
+
+def jupiter_event_log(years, jupiter_years, events=JUPITER_EVENTS):
+    """Liste des événements (un par libellé et par année) survenus dans la période simulée"""
+    catalog = events.drop_duplicates(['year', 'event'])
+    rows, owners = event_row_positions(years, catalog['year'].to_numpy())
+    # Première ligne couverte par chaque événement présent dans la période
+    present, first = np.unique(owners, return_index=True)
+    first_rows = rows[first]
+    order = np.argsort(first_rows, kind='stable')
+    jupiter_years = np.asarray(jupiter_years)
+
+    log = []
+    for owner, row in zip(present[order], first_rows[order]):
+        event = catalog.iloc[owner]
+        log.append({
+            "year": int(event['year']),
+            "event": event['event'],
+            "type": event['type'],
+            "severity": event['severity'],
+            "jupiter_year": float(jupiter_years[row])
+        })
+    return log
+
+
+def jupiter_event_frame(log, compact=True):
+    """DataFrame d'une liste d'événements (jupiter_event_log) ; type et sévérité en catégories si compact"""
+    df = pd.DataFrame(log, columns=['year', 'event', 'type', 'severity', 'jupiter_year'])
+    if compact:
+        df = df.astype({'type': 'category', 'severity': 'category'})
+    return df
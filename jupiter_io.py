@@ -0,0 +1,135 @@
+"""Écriture des jeux de données joviens dans différents formats de fichier.
+
+Chaque format est un écrivain enregistré dans OUTPUT_WRITERS
+(nom -> extension et fonction ``writer(df, path, metadata)``). Les
+formats colonnes (Parquet, Arrow IPC/Feather, NPZ) conservent les types
+et portent en métadonnées la configuration et la graine du jeu de données.
+Les colonnes de mesures sont stockées en float32 quand la précision le
+permet ; les axes temporels restent en float64.
+"""
+import filecmp
+import json
+import os
+import uuid
+
+import numpy as np
+
+from jupiter_cache import HAS_PYARROW, save_npz
+from jupiter_core import TIME_COLUMNS
+from jupiter_profiling import profiled
+
+# Clé des métadonnées (schéma Arrow / entrée NPZ)
+METADATA_KEY = 'jupiter'
+# Erreur relative maximale tolérée par l'arrondi float32
+FLOAT32_RTOL = 1e-6
+
+OUTPUT_WRITERS = {}
+
+
+def register_writer(name, extension, requires_pyarrow=False):
+    """Enregistre une fonction d'écriture writer(df, path, metadata) pour un format"""
+    def decorator(writer):
+        if not requires_pyarrow or HAS_PYARROW:
+            OUTPUT_WRITERS[name] = (extension, writer)
+        return writer
+    return decorator
+
+
+def downcast_floats(df, rtol=FLOAT32_RTOL):
+    """Copie du DataFrame où les colonnes float64 de mesures passent en float32 si l'arrondi reste sous rtol"""
+    columns = {}
+    for column in df.columns:
+        values = df[column].to_numpy()
+        if values.dtype != np.float64 or column in TIME_COLUMNS:
+            continue
+        downcast = values.astype(np.float32)
+        finite = np.isfinite(values)
+        if not np.array_equal(finite, np.isfinite(downcast)):
+            continue  # dépassement de la plage float32
+        error = np.abs(downcast[finite].astype(np.float64) - values[finite])
+        if np.all(error <= rtol * np.abs(values[finite])):
+            columns[column] = downcast
+    return df.assign(**columns) if columns else df
+
+
+@profiled('write_dataset')
+def write_dataset(df, directory, stem, output_format='csv', metadata=None, float32=True):
+    """Écrit le DataFrame dans directory/stem.<extension> au format demandé et retourne le chemin.
+
+    L'écriture passe par un fichier temporaire ; si le résultat est identique
+    au fichier existant, celui-ci est conservé tel quel (date de
+    modification inchangée, ce qui évite de retracer les figures).
+    """
+    if output_format not in OUTPUT_WRITERS:
+        raise ValueError(f"Format de sortie indisponible: {output_format} "
+                         f"(choix: {', '.join(OUTPUT_WRITERS)})")
+    extension, writer = OUTPUT_WRITERS[output_format]
+    os.makedirs(directory or '.', exist_ok=True)
+    path = os.path.normpath(os.path.join(directory or '.', f'{stem}{extension}'))
+    if float32 and output_format != 'csv':
+        df = downcast_floats(df)
+    temporary = _create_temporary(os.path.dirname(path), extension + '.tmp')
+    try:
+        writer(df, temporary, metadata or {})
+        if not (os.path.exists(path) and filecmp.cmp(temporary, path, shallow=False)):
+            os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return path
+
+
+def _create_temporary(directory, suffix):
+    """Crée un fichier vide au nom unique dans directory, aux droits usuels (umask appliqué par le système).
+
+    Contrairement à tempfile.mkstemp (0600), le fichier produit reste
+    lisible par les autres utilisateurs si l'umask le permet.
+    """
+    path = os.path.join(directory, f'tmp{uuid.uuid4().hex}{suffix}')
+    os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+    return path
+
+
+def read_metadata(path):
+    """Relit les métadonnées Jupiter d'un fichier Parquet, Feather ou NPZ"""
+    if path.endswith('.npz'):
+        with np.load(path, allow_pickle=False) as archive:
+            return json.loads(str(archive['__metadata__']))
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    schema = pq.read_schema(path) if path.endswith('.parquet') else feather.read_table(path).schema
+    return json.loads(schema.metadata[METADATA_KEY.encode()])
+
+
+def _arrow_table(df, metadata):
+    # pyarrow (long à importer) n'est chargé que pour les formats colonnes
+    import pyarrow as pa
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    encoded = json.dumps(metadata, default=str).encode()
+    return table.replace_schema_metadata({**(table.schema.metadata or {}), METADATA_KEY.encode(): encoded})
+
+
+@register_writer('csv', '.csv')
+def write_csv(df, path, metadata):
+    """CSV (sans métadonnées, compatible avec les sorties historiques)"""
+    df.to_csv(path, index=False)
+
+
+@register_writer('parquet', '.parquet', requires_pyarrow=True)
+def write_parquet(df, path, metadata, compression='zstd'):
+    """Parquet compressé (zstd)"""
+    import pyarrow.parquet as pq
+    pq.write_table(_arrow_table(df, metadata), path, compression=compression)
+
+
+@register_writer('feather', '.feather', requires_pyarrow=True)
+def write_feather(df, path, metadata, compression='lz4'):
+    """Arrow IPC (Feather v2), relu sans analyse syntaxique"""
+    import pyarrow.feather as feather
+    feather.write_feather(_arrow_table(df, metadata), path, compression=compression)
+
+
+@register_writer('npz', '.npz')
+def write_npz(df, path, metadata):
+    """Archive NumPy compressée : une entrée par colonne, plus les noms de colonnes et les métadonnées"""
+    save_npz(path, df, metadata, compress=True)
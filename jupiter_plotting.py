@@ -0,0 +1,392 @@
+"""Figures matplotlib de l'analyse des données joviennes.
+
+Module séparé du moteur de simulation (jupiter_core) : matplotlib n'est
+importé qu'à la première figure demandée. Les fonctions de tracé prennent
+l'analyseur (configuration, période, lissage) et le DataFrame généré.
+"""
+import json
+import os
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+from jupiter_cache import frame_fingerprint
+from jupiter_core import year_bounds
+from jupiter_profiling import profiled, stage
+
+def analysis_path(analyzer, output_dir='.', image_format='png', data_path=None):
+    """Chemin de la figure d'analyse : nommée d'après le fichier de données (période comprise) s'il est connu"""
+    if data_path:
+        stem = os.path.splitext(os.path.basename(data_path))[0]
+    else:
+        stem = f'jupiter_{analyzer.data_type}'
+    return os.path.join(output_dir, f'{stem}_analysis.{image_format}')
+
+def create_jupiter_analysis(analyzer, df, show=True, output_dir='.', dpi=300, image_format='png', data_path=None):
+    """Crée la figure d'analyse et retourne son chemin (show=False : rendu sans pyplot ni affichage)"""
+    path = analysis_path(analyzer, output_dir, image_format, data_path)
+    if show:
+        plt.style.use('dark_background')
+        fig = plt.figure(figsize=(20, 28))
+        draw_jupiter_analysis(analyzer, fig, df)
+        with stage('plot/savefig'):
+            fig.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='black', edgecolor='none')
+        plt.show()
+    else:
+        render_jupiter_analysis(analyzer, df, path, dpi=dpi, data_path=data_path)
+    return path
+
+@profiled('render_jupiter_analysis')
+def render_jupiter_analysis(analyzer, df, path, dpi=300, data_path=None):
+    """Enregistre la figure d'analyse via l'API objet (Figure + Agg), sans état pyplot global.
+    
+    Le format (png, svg, webp) suit l'extension de path. Avec data_path,
+    les entrées du rendu (fichier de données, empreinte des données, dpi,
+    format) sont notées dans le fichier voisin <image>.json et le rendu est
+    ignoré si l'image existe avec les mêmes entrées ; retourne True si
+    l'image a été (re)générée.
+    """
+    inputs = None
+    if data_path:
+        inputs = {
+            'data_path': os.path.abspath(data_path),
+            'data_fingerprint': frame_fingerprint(df),
+            'dpi': dpi,
+            'format': os.path.splitext(path)[1].lstrip('.'),
+        }
+        if os.path.exists(path) and _read_render_inputs(path) == inputs:
+            return False
+    with matplotlib.style.context('dark_background'):
+        fig = Figure(figsize=(20, 28))
+        draw_jupiter_analysis(analyzer, fig, df)
+        with stage('plot/savefig'):
+            fig.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='black', edgecolor='none')
+    if inputs is not None:
+        with open(f'{path}.json', 'w', encoding='utf-8') as target:
+            json.dump(inputs, target, sort_keys=True)
+    return True
+
+def _read_render_inputs(path):
+    """Entrées notées lors du dernier rendu de l'image path (None si absentes ou illisibles)"""
+    try:
+        with open(f'{path}.json', encoding='utf-8') as source:
+            return json.load(source)
+    except (OSError, ValueError):
+        return None
+
+def draw_jupiter_analysis(analyzer, fig, df):
+    """Trace les dix panneaux de l'analyse sur la figure"""
+    panels = [
+        plot_jupiter_cycle,          # 1. Cycle jovien principal
+        plot_observation_quality,    # 2. Qualité d'observation historique
+        plot_storm_activity,         # 3. Activité des tempêtes
+        plot_great_red_spot,         # 4. Évolution de la Grande Tache Rouge
+        plot_magnetic_activity,      # 5. Activité magnétique
+        plot_smoothed_data_plot,     # 6. Données lissées
+        plot_radiation_levels,       # 7. Niveaux de radiation
+        plot_moon_influences,        # 8. Influences des lunes
+        plot_jupiter_index,          # 9. Indice jovien
+        plot_future_predictions,     # 10. Prédictions futures
+    ]
+    for ax, plot in zip(fig.subplots(5, 2).flat, panels):
+        with stage(f'plot/{plot.__name__}'):
+            plot(analyzer, df, ax)
+    
+    fig.suptitle(f'Analyse des Données Joviennes: {analyzer.config["description"]} ({analyzer.start_year}-{analyzer.end_year})', 
+                 fontsize=16, fontweight='bold', color='#D8CA9D')
+    with stage('plot/tight_layout'):
+        fig.tight_layout()
+
+def plot_jupiter_cycle(analyzer, df, ax):
+    """Plot du cycle jovien principal"""
+    ax.plot(df['Earth_Year'], df['Base_Value'], label='Valeur de base', 
+           linewidth=2, color='#D8CA9D', alpha=0.9, gid='Base_Value')
+    
+    ax.set_title(f'Cycle Jovien Principal - {analyzer.config["description"]}', 
+                fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel(analyzer.config["unit"], color='#D8CA9D')
+    ax.tick_params(axis='y', labelcolor='#D8CA9D')
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+    
+    # Ajouter des annotations pour les missions
+    missions = {
+        1610: 'Galilée\nlunes',
+        1973: 'Pioneer 10\n1er survol',
+        1979: 'Voyager\n1&2',
+        1995: 'Galileo\norbite',
+        2016: 'Juno\norbite polaire'
+    }
+    
+    # Lignes des années de mission par recherche dichotomique (Earth_Year est trié)
+    years = df['Earth_Year'].to_numpy()
+    base_values = df['Base_Value'].to_numpy()
+    rows = np.searchsorted(years, list(missions))
+    for (year, label), row in zip(missions.items(), rows):
+        if row < len(years) and years[row] == year:
+            y_val = base_values[row]
+            ax.annotate(label, xy=(year, y_val), xytext=(year, y_val*1.1),
+                       arrowprops=dict(arrowstyle='->', color='yellow'),
+                       color='yellow', fontsize=8, ha='center', gid=f'mission:{year}')
+
+def plot_observation_quality(analyzer, df, ax):
+    """Plot de la qualité d'observation"""
+    ax.fill_between(df['Earth_Year'], df['Observation_Quality'], alpha=0.7, 
+                   color='#B8A86D', label='Qualité d\'observation', gid='Observation_Quality')
+    
+    ax.set_title('Qualité d\'Observation Historique', fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel('Qualité (%)', color='#B8A86D')
+    ax.set_xlabel('Année Terrestre', color='white')
+    ax.set_ylim(0, 100)
+    ax.tick_params(axis='y', labelcolor='#B8A86D')
+    ax.tick_params(axis='x', labelcolor='white')
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+
+def plot_storm_activity(analyzer, df, ax):
+    """Plot de l'activité des tempêtes"""
+    ax.plot(df['Earth_Year'], df['Atmospheric_Storms'], label='Activité des tempêtes', 
+           color='#FF6347', alpha=0.7, linewidth=2, gid='Atmospheric_Storms')
+    
+    ax.set_title('Activité des Tempêtes Atmosphériques', fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel('Intensité relative', color='white')
+    ax.legend()
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+    ax.tick_params(colors='white')
+
+def plot_great_red_spot(analyzer, df, ax):
+    """Plot de l'évolution de la Grande Tache Rouge"""
+    ax.plot(df['Earth_Year'], df['Great_Red_Spot_Evolution'], label='Grande Tache Rouge', 
+           linewidth=2, color='#FF4500', gid='Great_Red_Spot_Evolution')
+    
+    ax.set_title('Évolution de la Grande Tache Rouge', fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel('Taille relative', color='white')
+    ax.legend()
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+    ax.tick_params(colors='white')
+
+def plot_magnetic_activity(analyzer, df, ax):
+    """Plot de l'activité magnétique"""
+    ax.plot(df['Earth_Year'], df['Magnetic_Activity'], label='Activité magnétique', 
+           linewidth=2, color='#1E90FF', gid='Magnetic_Activity')
+    
+    ax.set_title('Activité Magnétique Jovienne', fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel('Intensité relative', color='white')
+    ax.legend()
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+    ax.tick_params(colors='white')
+
+def plot_smoothed_data_plot(analyzer, df, ax):
+    """Plot des données lissées"""
+    ax.plot(df['Earth_Year'], df['Base_Value'], label='Données brutes', 
+           alpha=0.5, color='#B8A86D', gid='Base_Value')
+    ax.plot(df['Earth_Year'], df['Smoothed_Value'], label=f'Données lissées ({analyzer.smoothing_window} ans)', 
+           linewidth=2, color='#00FF7F', gid='Smoothed_Value')
+    
+    ax.set_title('Données Brutes vs Lissées', fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel(analyzer.config["unit"], color='white')
+    ax.legend()
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+    ax.tick_params(colors='white')
+
+def plot_radiation_levels(analyzer, df, ax):
+    """Plot des niveaux de radiation"""
+    ax.fill_between(df['Earth_Year'], df['Radiation_Variations'], alpha=0.6, 
+                   color='#FFD700', label='Ceintures de radiation', gid='Radiation_Variations')
+    
+    ax.set_title('Niveaux de Radiation Joviens', fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel('Intensité relative', color='white')
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+    ax.tick_params(colors='white')
+
+def plot_moon_influences(analyzer, df, ax):
+    """Plot des influences des lunes"""
+    ax.plot(df['Earth_Year'], df['Moon_Influences'], label='Influences des lunes', 
+           linewidth=2, color='#DA70D6', gid='Moon_Influences')
+    
+    ax.set_title('Influences des Lunes Galiléennes', fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel('Influence relative', color='white')
+    ax.legend()
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+    ax.tick_params(colors='white')
+
+def plot_jupiter_index(analyzer, df, ax):
+    """Plot de l'indice jovien composite"""
+    ax.plot(df['Earth_Year'], df['Jupiter_Index'], label='Indice jovien composite', 
+           linewidth=2, color='#00CED1', gid='Jupiter_Index')
+    
+    ax.set_title('Indice Jovien Composite', fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel('Valeur de l\'indice', color='white')
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+    ax.tick_params(colors='white')
+
+def plot_future_predictions(analyzer, df, ax):
+    """Plot des prédictions futures"""
+    ax.plot(df['Earth_Year'], df['Base_Value'], label='Données historiques', 
+           color='#B8A86D', alpha=0.7, gid='Base_Value')
+    ax.plot(df['Earth_Year'], df['Future_Prediction'], label='Projections', 
+           linewidth=2, color='#00FFFF', linestyle='--', gid='Future_Prediction')
+    
+    ax.axvline(x=2020, color='yellow', linestyle=':', alpha=0.7, label='Début des prédictions')
+    
+    ax.set_title('Données Historiques et Projections Futures', fontsize=12, fontweight='bold', color='#D8CA9D')
+    ax.set_ylabel(analyzer.config["unit"], color='white')
+    ax.legend()
+    ax.grid(True, alpha=0.2, color='white')
+    ax.set_facecolor('black')
+    ax.tick_params(colors='white')
+
+class JupiterAnalysisFigure:
+    """Figure d'analyse persistante : les artistes sont créés une fois puis mis à jour en place.
+    
+    set_year_range() et set_data() remplacent les données des courbes
+    (set_data / set_verts) et ajustent les limites des axes, sans retracer
+    les dix panneaux. En mode interactif (fenêtre pyplot), une mise à jour
+    qui ne change pas les limites est affichée par blitting.
+    """
+    
+    def __init__(self, analyzer, df, interactive=False):
+        self.analyzer = analyzer
+        self.interactive = interactive
+        with matplotlib.style.context('dark_background'):
+            self.fig = plt.figure(figsize=(20, 28)) if interactive else Figure(figsize=(20, 28))
+            # Tracé initial sur toutes les données : chaque annotation de mission existe
+            draw_jupiter_analysis(analyzer, self.fig, df)
+        
+        # Artistes des séries (gid = colonne) et annotations de missions (gid = "mission:<année>")
+        self._series = [(artist, artist.get_gid()) for ax in self.fig.axes
+                        for artist in list(ax.lines) + list(ax.collections) if artist.get_gid()]
+        self._missions = [(text, int(text.get_gid().split(':')[1])) for ax in self.fig.axes
+                          for text in ax.texts if (text.get_gid() or '').startswith('mission:')]
+        # Les axes dont les limites ont été fixées par le tracé (ex. qualité 0-100 %) ne sont pas recadrés
+        self._autoscale = {ax: (ax.get_autoscalex_on(), ax.get_autoscaley_on()) for ax in self.fig.axes}
+        self._background = None
+        if interactive:
+            # Artistes animés : exclus du fond mis en cache pour le blitting
+            for artist, _ in self._series:
+                artist.set_animated(True)
+            self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        
+        self.df = df
+        self._years = df['Earth_Year'].to_numpy()
+        self.year_range = (self._years[0], self._years[-1])
+    
+    def set_data(self, df, year_range=None):
+        """Remplace les données affichées (même type de données), fenêtre conservée par défaut"""
+        self.df = df
+        self._years = df['Earth_Year'].to_numpy()
+        self.set_year_range(*(year_range or self.year_range))
+    
+    def set_year_range(self, start, end):
+        """Restreint l'affichage aux années [start, end] en mettant à jour les artistes existants"""
+        self.year_range = (start, end)
+        lo, hi = year_bounds(self._years, start, end)
+        years = self._years[lo:hi]
+        window = self.df.iloc[lo:hi]
+        
+        for artist, column in self._series:
+            values = window[column].to_numpy()
+            if isinstance(artist, Line2D):
+                artist.set_data(years, values)
+            else:
+                # Surface remplie entre 0 et la série (fill_between)
+                artist.set_verts([np.concatenate([np.column_stack([years, values]),
+                                                  np.column_stack([years[::-1], np.zeros(len(years))])])])
+        
+        base_values = window['Base_Value'].to_numpy()
+        for text, year in self._missions:
+            row = np.searchsorted(years, year)
+            visible = row < len(years) and years[row] == year
+            text.set_visible(visible)
+            if visible:
+                text.xy = (year, base_values[row])
+                text.set_position((year, base_values[row] * 1.1))
+        
+        limits_changed = self._rescale(years, window)
+        self._refresh(limits_changed)
+    
+    def _rescale(self, years, window):
+        """Recadre les axes sur la fenêtre ; retourne True si une limite a changé"""
+        if len(years) == 0:
+            return False
+        changed = False
+        for ax, (scale_x, scale_y) in self._autoscale.items():
+            columns = [(column, not isinstance(artist, Line2D))
+                       for artist, column in self._series if artist.axes is ax]
+            if not columns:
+                continue
+            margin_x, margin_y = ax.margins()
+            limits = (ax.get_xlim(), ax.get_ylim())
+            if scale_x:
+                ax.set_xlim(*_padded_limits(years[0], years[-1], margin_x))
+            if scale_y:
+                values = [window[column].to_numpy() for column, _ in columns]
+                # Les surfaces remplies partent de 0
+                values += [np.zeros(1) for _, filled in columns if filled]
+                values = np.concatenate(values)
+                if np.isfinite(values).any():
+                    ax.set_ylim(*_padded_limits(np.nanmin(values), np.nanmax(values), margin_y))
+            changed |= limits != (ax.get_xlim(), ax.get_ylim())
+        return changed
+    
+    def _refresh(self, limits_changed):
+        """Affiche la mise à jour : redessin complet si les axes ont changé, sinon blitting"""
+        if not self.interactive:
+            return  # Rendu au prochain savefig
+        canvas = self.fig.canvas
+        if limits_changed or self._background is None or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        self._draw_series()
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+    
+    def _on_draw(self, event):
+        """Après un redessin complet : mise en cache du fond puis tracé des courbes animées"""
+        canvas = self.fig.canvas
+        if canvas.supports_blit:
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_series()
+    
+    def _draw_series(self):
+        for artist, _ in self._series:
+            artist.axes.draw_artist(artist)
+    
+    def add_range_slider(self):
+        """Ajoute un curseur d'intervalle d'années (matplotlib.widgets.RangeSlider) sous les panneaux"""
+        from matplotlib.widgets import RangeSlider
+        self.fig.subplots_adjust(bottom=0.05)
+        slider_ax = self.fig.add_axes([0.15, 0.015, 0.7, 0.01])
+        slider = RangeSlider(slider_ax, 'Années', self._years[0], self._years[-1], valinit=self.year_range)
+        slider.on_changed(lambda values: self.set_year_range(*values))
+        self._slider = slider
+        return slider
+    
+    def savefig(self, path, dpi=300):
+        """Enregistre l'état courant de la figure (courbes animées comprises)"""
+        animated = [artist for artist, _ in self._series if artist.get_animated()]
+        for artist in animated:
+            artist.set_animated(False)
+        try:
+            self.fig.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='black', edgecolor='none')
+        finally:
+            for artist in animated:
+                artist.set_animated(True)
+
+def _padded_limits(low, high, margin):
+    """Limites d'axe avec une marge relative, comme l'autoscale de matplotlib"""
+    span = high - low
+    if span == 0:
+        span = abs(low) or 1.0
+    return low - margin * span, high + margin * span
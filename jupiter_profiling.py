@@ -0,0 +1,142 @@
+"""Mesure du temps passé par étape (simulation, événements, figures, sérialisation, exports).
+
+Les étapes sont délimitées par ``with stage(nom):`` ou le décorateur
+``@profiled(nom)``. Sans profileur actif, une étape coûte une lecture de
+ContextVar et un ``nullcontext`` partagé : rien n'est mesuré ni stocké.
+
+    with Profiler(memory=True) as profiler:
+        analyzer.generate_jupiter_data()
+    print(profiler.report())
+
+Le profileur actif est propre au contexte d'exécution (thread, session
+Streamlit). Les temps sont inclusifs : une étape compte aussi ses
+sous-étapes. Avec memory=True, tracemalloc mesure le pic de mémoire
+allouée pendant chaque étape et relève les principaux sites
+d'allocation encore vivants à la fermeture ; tracemalloc étant global au
+processus, ces pics incluent les allocations des autres threads.
+"""
+import contextlib
+import contextvars
+import functools
+import time
+import tracemalloc
+
+import pandas as pd
+
+_ACTIVE = contextvars.ContextVar('jupiter_profiler', default=None)
+_DISABLED = contextlib.nullcontext()
+
+# Colonnes du résumé : appels, temps inclusifs (ms) et pic mémoire (Mio)
+SUMMARY_COLUMNS = ['stage', 'calls', 'total_ms', 'mean_ms', 'max_ms', 'peak_mib']
+
+
+def stage(name):
+    """Contexte qui mesure l'étape name si un profileur est actif (sinon sans effet)"""
+    profiler = _ACTIVE.get()
+    return _DISABLED if profiler is None else profiler.stage(name)
+
+
+def profiled(name=None):
+    """Décorateur : chaque appel de la fonction est une étape (nom par défaut : __qualname__)"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _ACTIVE.get()
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.stage(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class Profiler:
+    """Temps (et pic mémoire optionnel) cumulés par étape, actif dans un bloc with"""
+
+    def __init__(self, memory=False, top_allocations=5):
+        self.memory = memory
+        self.top_allocations = top_allocations
+        # étape -> [appels, total (s), max (s), pic mémoire (octets)]
+        self.records = {}
+        self.allocations = []
+        self._stack = []
+        self._token = None
+        self._started_tracing = False
+
+    def __enter__(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._token = _ACTIVE.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _ACTIVE.reset(self._token)
+        if self.memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            self.allocations = [(str(statistic.traceback[0]), statistic.size)
+                                for statistic in snapshot.statistics('lineno')[:self.top_allocations]]
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return False
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Mesure un bloc ; le pic mémoire d'une étape englobe celui de ses sous-étapes"""
+        memory = self.memory and tracemalloc.is_tracing()
+        if memory:
+            # Le pic global de tracemalloc est remis à zéro : celui du parent est conservé dans la pile
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            tracemalloc.reset_peak()
+        frame = [current if memory else 0, 0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            peak = 0
+            if memory:
+                absolute_peak = max(tracemalloc.get_traced_memory()[1], frame[1])
+                # tracemalloc a pu être arrêté entre-temps par un autre profileur du processus
+                peak = max(0, absolute_peak - frame[0])
+                if self._stack:
+                    self._stack[-1][1] = max(self._stack[-1][1], absolute_peak)
+            self._record(name, 1, elapsed, elapsed, peak)
+
+    def _record(self, name, calls, total, longest, peak):
+        record = self.records.setdefault(name, [0, 0.0, 0.0, 0])
+        record[0] += calls
+        record[1] += total
+        record[2] = max(record[2], longest)
+        record[3] = max(record[3], peak)
+
+    def merge(self, records):
+        """Ajoute les mesures d'un autre profileur (ex. renvoyées par un processus de --all)"""
+        for name, (calls, total, longest, peak) in records.items():
+            self._record(name, calls, total, longest, peak)
+
+    def summary(self):
+        """DataFrame des étapes, de la plus coûteuse à la moins coûteuse (temps inclusifs)"""
+        rows = [(name, calls, total * 1000, total * 1000 / calls, longest * 1000, peak / 1024 ** 2)
+                for name, (calls, total, longest, peak) in self.records.items()]
+        df = pd.DataFrame(rows, columns=SUMMARY_COLUMNS).sort_values('total_ms', ascending=False)
+        if not self.memory:
+            df = df.drop(columns='peak_mib')
+        return df.reset_index(drop=True)
+
+    def report(self):
+        """Résumé texte : tableau des étapes puis principaux sites d'allocation"""
+        if not self.records:
+            return "Aucune étape mesurée"
+        lines = [self.summary().to_string(index=False, float_format=lambda value: f'{value:.2f}')]
+        if self.allocations:
+            lines.append("\nMémoire allouée encore vivante (principaux sites):")
+            lines += [f"  {size / 1024 ** 2:8.2f} Mio  {site}" for site, size in self.allocations]
+        return '\n'.join(lines)
@@ -0,0 +1,123 @@
+"""Lissage des séries joviennes en temps linéaire.
+
+Toutes les méthodes utilisent une fenêtre centrée de ``window`` échantillons
+(demi-fenêtre ``window // 2`` de chaque côté). Aux bords de la série la
+fenêtre est tronquée et les poids renormalisés, comme la moyenne glissante
+d'origine de ``_simulate_smoothed_data``.
+"""
+import numpy as np
+
+SMOOTHING_KERNELS = ('moving_average', 'exponential', 'gaussian', 'savgol')
+
+# Au-delà de cette taille de noyau, la convolution passe par la FFT
+_FFT_THRESHOLD = 64
+
+
+def smooth_series(values, window=5, kernel='moving_average', polyorder=2):
+    """Lisse une série avec le noyau demandé (moyenne glissante, exponentiel, gaussien ou Savitzky–Golay)"""
+    values = np.asarray(values, dtype=float)
+    half = min(int(window) // 2, max(len(values) - 1, 0))
+    if half == 0:
+        return values.copy()
+
+    if kernel == 'moving_average':
+        return _moving_average(values, half)
+    if kernel == 'savgol':
+        return _savitzky_golay(values, half, polyorder)
+    if kernel in ('exponential', 'gaussian'):
+        weights = _symmetric_weights(kernel, half)
+        return _convolve_same(values, weights) / _edge_normalization(len(values), weights)
+    raise ValueError(f"Noyau de lissage inconnu: {kernel} (choix: {', '.join(SMOOTHING_KERNELS)})")
+
+
+def _moving_average(values, half):
+    """Moyenne glissante centrée par sommes cumulées, fenêtre tronquée aux bords"""
+    n = len(values)
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    index = np.arange(n)
+    lo = np.maximum(index - half, 0)
+    hi = np.minimum(index + half + 1, n)
+    return (cumulative[hi] - cumulative[lo]) / (hi - lo)
+
+
+def _symmetric_weights(kernel, half):
+    """Poids symétriques de longueur 2 * half + 1"""
+    offsets = np.arange(-half, half + 1)
+    if kernel == 'exponential':
+        # Décroissance exponentielle double, constante de temps half / 2
+        return np.exp(-np.abs(offsets) / (half / 2))
+    # Gaussienne couvrant ±2 écarts-types sur la demi-fenêtre
+    return np.exp(-0.5 * (offsets / (half / 2)) ** 2)
+
+
+def _convolve_same(values, weights):
+    """Convolution centrée (mode 'same'), directe pour les petits noyaux et par FFT sinon"""
+    if len(weights) <= _FFT_THRESHOLD:
+        full = np.convolve(values, weights, mode='full')
+    else:
+        size = len(values) + len(weights) - 1
+        nfft = 1 << (size - 1).bit_length()
+        full = np.fft.irfft(np.fft.rfft(values, nfft) * np.fft.rfft(weights, nfft), nfft)[:size]
+    start = (len(weights) - 1) // 2
+    return full[start:start + len(values)]
+
+
+def _edge_normalization(n, weights):
+    """Somme des poids effectivement dans la série pour chaque position (fenêtre tronquée)"""
+    half = len(weights) // 2
+    cumulative = np.concatenate(([0.0], np.cumsum(weights)))
+    index = np.arange(n)
+    first = np.maximum(-half, -index) + half
+    last = np.minimum(half, n - 1 - index) + half
+    return cumulative[last + 1] - cumulative[first]
+
+
+def _savitzky_golay(values, half, polyorder):
+    """Filtre de Savitzky–Golay : ajustement polynomial local, fenêtres tronquées aux bords"""
+    n = len(values)
+    offsets = np.arange(-half, half + 1)
+    degree = min(polyorder, 2 * half)
+    # Coefficients de la valeur ajustée au centre de la fenêtre (noyau symétrique)
+    coefficients = np.linalg.pinv(np.vander(offsets, degree + 1, increasing=True))[0]
+    smoothed = _convolve_same(values, coefficients)
+
+    # Bords : ajustement sur la fenêtre tronquée, évalué au point courant ; le côté
+    # droit est le côté gauche de la série retournée. Là où les deux bords se
+    # recouvrent (série courte), le dernier écrit par la boucle d'origine l'emporte.
+    edges = min(half, n)
+    left = _savitzky_golay_edge(values, half, degree, edges)
+    right = _savitzky_golay_edge(values[::-1], half, degree, edges)
+    index = np.arange(edges)
+    smoothed[index] = left
+    smoothed[n - 1 - index] = right
+    keep_left = index > (n - 1) / 2
+    smoothed[index[keep_left]] = left[keep_left]
+    return smoothed
+
+
+def _savitzky_golay_edge(values, half, degree, count):
+    """Ajustements des count premiers points, chacun sur la fenêtre [0, i + half] tronquée à la série.
+
+    Les fenêtres sont emboîtées : les équations normales de toutes les
+    fenêtres se déduisent des sommes cumulées des moments, d'où un coût
+    linéaire en la taille de la fenêtre au lieu d'une pseudo-inverse par point.
+    """
+    n = len(values)
+    size = min(count + half, n)
+    # Abscisses ramenées dans [-1, 1] pour le conditionnement des moments
+    position = (np.arange(size) - half) / half
+    powers = position[:, None] ** np.arange(degree + 1)
+    gram = np.cumsum(powers[:, :, None] * powers[:, None, :], axis=0)
+    moments = np.cumsum(powers * values[:size, None], axis=0)
+
+    index = np.arange(count)
+    width = np.minimum(index + half + 1, n)
+    terms = np.minimum(degree, width - 1) + 1
+    fitted = np.empty(count)
+    # Moins de degree + 2 points : degré réduit (quelques fenêtres seulement)
+    for k in np.unique(terms):
+        rows = index[terms == k]
+        last = width[rows] - 1
+        solution = np.linalg.solve(gram[last][:, :k, :k], moments[last][:, :k, None])[..., 0]
+        fitted[rows] = np.einsum('ij,ij->i', powers[rows, :k], solution)
+    return fitted